@@ -7,329 +7,329 @@ Uses OpenAI GPT to understand user requests and execute them via the Hedera Agen
 """
 
 import asyncio
-import json
+import logging
 import os
+import random
 import sys
-from typing import Dict, Any, List
-from dotenv import load_dotenv
-import openai
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+import orjson
 
-# Add parent directory to path to import hedera_agent_kit
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from hedera_agent_kit.agent_registry import call_tool
+from hedera_agent_kit.client import client_manager, use_uvloop
+from hedera_agent_kit.ui import print_help, print_welcome
 
-from hedera_agent_kit import agent_registry
-from hedera_agent_kit.client import client_manager
+# Core tool definitions for OpenAI function calling, kept as data next to this script
+_TOOL_DEFINITIONS: Dict[str, Dict[str, Any]] = orjson.loads(
+    (Path(__file__).parent / "hedera_tools.json").read_bytes()
+)
 
-# Load environment variables
-load_dotenv()
+# OpenAI function-calling payload, built once at import and shared by every agent
+_AVAILABLE_TOOLS: List[Dict[str, Any]] = [
+    {
+        "type": "function",
+        "function": {
+            "name": tool_name,
+            "description": definition["description"],
+            "parameters": definition["parameters"]
+        }
+    }
+    for tool_name, definition in _TOOL_DEFINITIONS.items()
+]
+
+# Idempotent queries whose results can be served from cache for a few seconds
+_READ_TOOLS = frozenset({"get_balance", "get_balances", "get_topic_info"})
+_TOOL_CACHE_TTL = 10.0
+
+# Bound each OpenAI call and retry transient failures with jittered backoff;
+# reading the streamed completion gets its own overall limit
+_REQUEST_TIMEOUT = 30.0
+_STREAM_TIMEOUT = 120.0
+_MAX_ATTEMPTS = 3
+
+_EXIT_COMMANDS = frozenset({"quit", "exit", "bye"})
+_HELP_COMMANDS = frozenset({"help", "?"})
 
 class HederaAgent:
-    def __init__(self):
-        self.client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        self.available_tools = self._get_available_tools()
-        
-    def _get_available_tools(self) -> List[Dict[str, Any]]:
-        """Generate OpenAI function definitions from our agent registry"""
-        tools = []
-        
-        # Core tool definitions for OpenAI function calling
-        tool_definitions = {
-            "create_account": {
-                "description": "Create a new Hedera account with optional initial balance",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "initial_balance": {"type": "number", "description": "Initial HBAR balance (default: 0)"},
-                        "public_key": {"type": "string", "description": "Public key (optional, will generate if not provided)"}
-                    }
-                }
-            },
-            "transfer_hbar": {
-                "description": "Transfer HBAR from your account to another account",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "to_account_id": {"type": "string", "description": "Recipient account ID (format: 0.0.12345)"},
-                        "amount": {"type": "number", "description": "Amount in HBAR"},
-                        "memo": {"type": "string", "description": "Optional memo for the transfer"}
-                    },
-                    "required": ["to_account_id", "amount"]
-                }
-            },
-            "get_balance": {
-                "description": "Get account balance in HBAR",
-                "parameters": {
-                    "type": "object", 
-                    "properties": {
-                        "account_id": {"type": "string", "description": "Account ID (optional, defaults to your account)"}
-                    }
-                }
-            },
-            "create_fungible_token": {
-                "description": "Create a new fungible token",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "name": {"type": "string", "description": "Token name"},
-                        "symbol": {"type": "string", "description": "Token symbol (e.g., USD, BTC)"},
-                        "initial_supply": {"type": "integer", "description": "Initial supply amount"},
-                        "decimals": {"type": "integer", "description": "Number of decimal places"}
-                    },
-                    "required": ["name", "symbol", "initial_supply", "decimals"]
-                }
-            },
-            "create_non_fungible_token": {
-                "description": "Create a new NFT collection",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "name": {"type": "string", "description": "NFT collection name"},
-                        "symbol": {"type": "string", "description": "NFT collection symbol"}
-                    },
-                    "required": ["name", "symbol"]
-                }
-            },
-            "associate_token": {
-                "description": "Associate an account with a token (required before receiving tokens)",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "account_id": {"type": "string", "description": "Account ID to associate"},
-                        "token_id": {"type": "string", "description": "Token ID to associate with"}
-                    },
-                    "required": ["account_id", "token_id"]
-                }
-            },
-            "dissociate_token": {
-                "description": "Dissociate an account from a token",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "account_id": {"type": "string", "description": "Account ID to dissociate"},
-                        "token_id": {"type": "string", "description": "Token ID to dissociate from"}
-                    },
-                    "required": ["account_id", "token_id"]
-                }
-            },
-            "delete_token": {
-                "description": "Delete a token permanently",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "token_id": {"type": "string", "description": "Token ID to delete"}
-                    },
-                    "required": ["token_id"]
-                }
-            },
-            "create_topic": {
-                "description": "Create a new consensus topic for messaging",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "memo": {"type": "string", "description": "Topic description/memo"}
-                    }
-                }
-            },
-            "submit_message": {
-                "description": "Submit a message to a consensus topic",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "topic_id": {"type": "string", "description": "Topic ID to send message to"},
-                        "message": {"type": "string", "description": "Message content"}
-                    },
-                    "required": ["topic_id", "message"]
-                }
-            },
-            "get_topic_info": {
-                "description": "Get information about a consensus topic",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "topic_id": {"type": "string", "description": "Topic ID to query"}
-                    },
-                    "required": ["topic_id"]
-                }
-            }
-        }
+    def __init__(self, api_key: Optional[str] = None):
+        self.api_key = api_key if api_key is not None else os.getenv("OPENAI_API_KEY")
         
-        for tool_name, definition in tool_definitions.items():
-            tools.append({
-                "type": "function",
-                "function": {
-                    "name": tool_name,
-                    "description": definition["description"],
-                    "parameters": definition["parameters"]
-                }
-            })
+        # Deferred import: openai pulls in httpx/pydantic, which quick exits never need
+        import httpx
+        from openai import AsyncOpenAI, APITimeoutError, RateLimitError
         
-        return tools
+        # One pooled HTTP/2 client for the life of the agent so TLS handshakes are
+        # amortized and concurrent requests multiplex over a single connection
+        self._http = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+        )
+        # Built-in retries are disabled so _create_completion's bounded policy applies
+        self.client = AsyncOpenAI(api_key=self.api_key, http_client=self._http, max_retries=0)
+        self._retryable = (RateLimitError, APITimeoutError, asyncio.TimeoutError)
+        self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+        self.available_tools = _AVAILABLE_TOOLS
+        self._cache: Dict[bytes, Tuple[float, str]] = {}
+        self.refresh_system_prompt()
 
     async def execute_tool(self, tool_name: str, arguments: Dict[str, Any]) -> str:
         """Execute a Hedera tool via the agent registry"""
+        print(f"🔧 Executing: {tool_name}")
+        print(f"   Parameters: {arguments}")
+        
+        key = None
+        if tool_name in _READ_TOOLS:
+            key = orjson.dumps((tool_name, arguments), option=orjson.OPT_SORT_KEYS)
+            now = time.monotonic()
+            hit = self._cache.get(key)
+            if hit and now - hit[0] < _TOOL_CACHE_TTL:
+                return hit[1]
+        else:
+            # Any state-changing tool may invalidate cached reads; process_request
+            # clears again once the batch is done, for reads that were in flight
+            self._cache.clear()
+        
         try:
-            result = await agent_registry.call_tool(tool_name, arguments)
-            return str(result)
+            result = str(await call_tool(tool_name, arguments))
         except Exception as e:
             return f"❌ Error executing {tool_name}: {str(e)}"
+        
+        if key is not None and not result.startswith("❌"):
+            self._cache[key] = (now, result)
+        return result
+
+    def _build_system_prompt(self) -> str:
+        """Render the system prompt for the current client configuration"""
+        # Create system prompt with current network status
+        manager = client_manager()
+        network_info = f"Connected to {manager.network}" if manager.is_configured else "Running in mock mode"
+        operator_info = f"Operator: {manager.operator_id}" if manager.operator_id else "No operator configured"
+        
+        return f"""You are a helpful assistant for Hedera Hashgraph operations. 
+        You can help users create accounts, transfer HBAR, create tokens, manage consensus topics, and more.
+        Use the available functions to fulfill user requests. Be conversational and helpful.
+        
+        Current Status:
+        - Network: {network_info}
+        - {operator_info}
+        
+        Guidelines:
+        - Account IDs should be in format 0.0.12345
+        - When creating tokens, suggest reasonable defaults if not specified
+        - For transfers, remind users they need sufficient balance
+        - For token operations, remind about token association requirements
+        - Be helpful in explaining what operations are being performed
+        - If operations fail, provide helpful debugging tips"""
+
+    def refresh_system_prompt(self):
+        """Rebuild the cached system message after a client config change"""
+        self._system_message = {"role": "system", "content": self._build_system_prompt()}
+
+    def _dispatch_if_complete(self, call: Dict[str, str]) -> Optional[asyncio.Task]:
+        """Start a streamed tool call once its name and arguments are complete"""
+        if not call["name"]:
+            return None
+        try:
+            arguments = orjson.loads(call["arguments"])
+        except orjson.JSONDecodeError:
+            return None
+        return asyncio.create_task(self.execute_tool(call["name"], arguments))
+
+    async def _create_completion(self, user_input: str):
+        """Open the completion stream, retrying rate limits and timeouts with backoff"""
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                return await asyncio.wait_for(
+                    self.client.chat.completions.create(
+                        model=self.model,
+                        messages=[self._system_message, {"role": "user", "content": user_input}],
+                        tools=self.available_tools,
+                        tool_choice="auto",
+                        stream=True
+                    ),
+                    timeout=_REQUEST_TIMEOUT
+                )
+            except self._retryable:
+                if attempt == _MAX_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(min(2 ** attempt + random.random(), 10))
+
+    async def _read_stream(self, stream, calls: Dict[int, Dict[str, str]],
+                           tasks: Dict[int, asyncio.Task]) -> List[str]:
+        """Consume a completion stream, returning its text and filling in tool calls"""
+        # Accumulate streamed tool-call deltas by index and dispatch each
+        # call as soon as its arguments are complete JSON, so tools run
+        # while the rest of the completion is still being generated
+        content: List[str] = []
+        # Closing the stream releases its connection even when reading is cancelled
+        async with stream:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                if delta.content:
+                    content.append(delta.content)
+                for tool_call in delta.tool_calls or ():
+                    call = calls.setdefault(tool_call.index, {"name": "", "arguments": ""})
+                    if tool_call.function:
+                        call["name"] += tool_call.function.name or ""
+                        call["arguments"] += tool_call.function.arguments or ""
+                    if tool_call.index not in tasks:
+                        task = self._dispatch_if_complete(call)
+                        if task:
+                            tasks[tool_call.index] = task
+        return content
 
     async def process_request(self, user_input: str) -> str:
         """Process user request using OpenAI and execute appropriate tools"""
+        calls: Dict[int, Dict[str, str]] = {}
+        tasks: Dict[int, asyncio.Task] = {}
         try:
-            # Create system prompt with current network status
-            network_info = f"Connected to {client_manager.network}" if client_manager.is_configured else "Running in mock mode"
-            operator_info = f"Operator: {client_manager.operator_id}" if client_manager.operator_id else "No operator configured"
-            
-            system_prompt = f"""You are a helpful assistant for Hedera Hashgraph operations. 
-            You can help users create accounts, transfer HBAR, create tokens, manage consensus topics, and more.
-            Use the available functions to fulfill user requests. Be conversational and helpful.
-            
-            Current Status:
-            - Network: {network_info}
-            - {operator_info}
-            
-            Guidelines:
-            - Account IDs should be in format 0.0.12345
-            - When creating tokens, suggest reasonable defaults if not specified
-            - For transfers, remind users they need sufficient balance
-            - For token operations, remind about token association requirements
-            - Be helpful in explaining what operations are being performed
-            - If operations fail, provide helpful debugging tips"""
+            stream = await self._create_completion(user_input)
             
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_input}
-                ],
-                tools=self.available_tools,
-                tool_choice="auto"
-            )
-            
-            message = response.choices[0].message
+            try:
+                content = await asyncio.wait_for(self._read_stream(stream, calls, tasks), timeout=_STREAM_TIMEOUT)
+            except asyncio.TimeoutError:
+                return f"❌ Error processing request: no complete response within {_STREAM_TIMEOUT:g}s"
             
             # If OpenAI wants to call functions
-            if message.tool_calls:
-                results = []
-                for tool_call in message.tool_calls:
-                    function_name = tool_call.function.name
-                    arguments = json.loads(tool_call.function.arguments)
-                    
-                    print(f"🔧 Executing: {function_name}")
-                    print(f"   Parameters: {arguments}")
-                    
-                    result = await self.execute_tool(function_name, arguments)
-                    results.append(result)
+            if calls:
+                # Anything not yet dispatched must be complete once the stream ends
+                for index, call in calls.items():
+                    if index not in tasks:
+                        tasks[index] = asyncio.create_task(
+                            self.execute_tool(call["name"], orjson.loads(call["arguments"] or "{}"))
+                        )
+                indices = sorted(tasks)
+                results = await asyncio.gather(*(tasks[i] for i in indices), return_exceptions=True)
                 
-                return "\n".join(results)
+                # execute_tool already returns strings; only escaped exceptions need formatting
+                return "\n".join(
+                    result if isinstance(result, str) else f"❌ Error executing {calls[i]['name']}: {result}"
+                    for i, result in zip(indices, results)
+                )
             
             # If no function calls, just return the response
-            return message.content or "I'm not sure how to help with that request."
+            return "".join(content) or "I'm not sure how to help with that request."
             
         except Exception as e:
             return f"❌ Error processing request: {str(e)}"
+        finally:
+            # Tools dispatched before the stream failed (or this request was
+            # cancelled) must not keep running unobserved
+            pending = [task for task in tasks.values() if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            # A read that ran alongside a state-changing call may have cached the
+            # old state, so drop everything the batch stored
+            if any(call["name"] not in _READ_TOOLS for call in calls.values()):
+                self._cache.clear()
 
-    def print_welcome(self):
-        """Print welcome message and current status"""
-        print("🌟 Welcome to the Hedera CLI Agent! 🌟")
-        print("=" * 60)
-        print("I can help you interact with the Hedera network using natural language!")
-        
-        # Show current configuration status
-        print(f"\n⚙️  Configuration Status:")
-        print(f"   • Network: {client_manager.network}")
-        print(f"   • Operator: {client_manager.operator_id or 'Not configured'}")
-        print(f"   • Client: {'✅ Connected' if client_manager.is_configured else '❌ Not configured'}")
-        print(f"   • OpenAI: {'✅ Configured' if os.getenv('OPENAI_API_KEY') else '❌ Missing API key'}")
-        
-        if client_manager.is_configured:
-            print(f"   • Mode: 🌐 Live Network")
-        else:
-            print(f"   • Mode: 🧪 Mock/Testing")
-        
-        print(f"\n📋 What I can do:")
-        print("   • 🏦 Account Management: Create accounts, check balances, transfer HBAR")
-        print("   • 🪙 Token Operations: Create tokens, manage associations")
-        print("   • 💬 Consensus Service: Create topics, send messages")
-        print("   • 🔍 Query Operations: Get account info, token details, topic info")
-        
-        print(f"\n💡 Example commands:")
-        print("   • 'Create a new account with 10 HBAR'")
-        print("   • 'Transfer 5 HBAR to account 0.0.12345'")
-        print("   • 'Check my balance'")
-        print("   • 'Create a token called MyToken with symbol MT'")
-        print("   • 'Create a topic for announcements'")
-        
-        if not client_manager.is_configured:
-            print(f"\n⚠️  To use real Hedera operations:")
-            print("   1. Set HEDERA_NETWORK=testnet (or mainnet)")
-            print("   2. Set OPERATOR_ID=0.0.your_account_id")
-            print("   3. Set OPERATOR_KEY=your_private_key")
-            print("   4. Restart the agent")
-        
-        print("=" * 60)
-        print("Type 'quit', 'exit', or 'bye' to leave")
-        print("Type 'help' for more information\n")
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        await self._http.aclose()
 
-    def print_help(self):
-        """Print detailed help information"""
-        print("\n📚 Hedera CLI Agent Help")
-        print("=" * 40)
-        print("🏦 Account Operations:")
-        print("   • Create account: 'Create a new account with X HBAR'")
-        print("   • Check balance: 'What's my balance?' or 'Check balance of 0.0.12345'")
-        print("   • Transfer HBAR: 'Send X HBAR to 0.0.12345'")
-        print("\n🪙 Token Operations:")
-        print("   • Create token: 'Create a token called TokenName with symbol TKN'")
-        print("   • Create NFT: 'Create an NFT collection called MyNFTs'")
-        print("   • Associate token: 'Associate my account with token 0.0.12345'")
-        print("   • Delete token: 'Delete token 0.0.12345'")
-        print("\n💬 Consensus Operations:")
-        print("   • Create topic: 'Create a topic for announcements'")
-        print("   • Send message: 'Send message \"Hello World\" to topic 0.0.12345'")
-        print("   • Topic info: 'Get info about topic 0.0.12345'")
-        print("=" * 40 + "\n")
+async def _prompt(text: str) -> str:
+    """Read a line from stdin without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future = loop.create_future()
+    
+    def settle(line: Optional[str], error: Optional[BaseException]) -> None:
+        # The prompt may have been cancelled (Ctrl-C) while the read was blocked
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(line)
+    
+    def read() -> None:
+        # Unbuffered reads: interpreter shutdown locks sys.stdin's buffer, and a
+        # thread blocked inside it would abort the exit
+        try:
+            print(text, end="", flush=True)
+            raw = sys.stdin.buffer.raw.readline()
+            if not raw:
+                raise EOFError
+            line, error = raw.decode(sys.stdin.encoding or "utf-8", errors="replace").rstrip("\r\n"), None
+        except Exception as e:
+            line, error = None, e
+        try:
+            loop.call_soon_threadsafe(settle, line, error)
+        except RuntimeError:
+            pass  # The loop closed while waiting for input
+    
+    # A daemon thread rather than the default executor: asyncio.run joins the
+    # executor on shutdown, which would wait for Enter after Ctrl-C
+    threading.Thread(target=read, daemon=True).start()
+    return await future
 
 async def main():
-    # Check for required environment variables
-    if not os.getenv("OPENAI_API_KEY"):
+    # The client manager reports its setup through logging
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    # httpx logs every request at INFO; keep the conversation readable
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    
+    # .env supplies OPENAI_MODEL and the Hedera settings too, not just the key;
+    # variables already set in the environment still take precedence
+    from dotenv import load_dotenv
+    load_dotenv()
+    
+    # Read the key once; the agent carries it from here on
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
         print("❌ Error: OPENAI_API_KEY environment variable is required!")
         print("Please add your OpenAI API key to the .env file:")
         print("   OPENAI_API_KEY=your_api_key_here")
         print("\nGet an API key from: https://platform.openai.com/api-keys")
         return
     
-    agent = HederaAgent()
-    agent.print_welcome()
-    
-    while True:
-        try:
-            # Get user input
-            user_input = input("🤖 You: ").strip()
+    agent = HederaAgent(api_key=api_key)
+    print_welcome(client_manager(), openai_configured=bool(agent.api_key), model=agent.model)
+    try:
+        while True:
+            try:
+                user_input = (await _prompt("🤖 You: ")).strip()
             
-            # Check for exit commands
-            if user_input.lower() in ['quit', 'exit', 'bye']:
-                print("👋 Goodbye! Thanks for using the Hedera CLI Agent!")
-                break
+                command = user_input.lower()
             
-            # Check for help command
-            if user_input.lower() in ['help', '?']:
-                agent.print_help()
-                continue
+                # Check for exit commands
+                if command in _EXIT_COMMANDS:
+                    print("👋 Goodbye! Thanks for using the Hedera CLI Agent!")
+                    break
             
-            if not user_input:
-                continue
+                # Check for help command
+                if command in _HELP_COMMANDS:
+                    print_help()
+                    continue
             
-            # Process the request
-            print("🤔 Thinking...")
-            response = await agent.process_request(user_input)
-            print(f"\n{response}\n")
+                if not user_input:
+                    continue
             
-        except KeyboardInterrupt:
-            print("\n👋 Goodbye! Thanks for using the Hedera CLI Agent!")
-            break
-        except Exception as e:
-            print(f"❌ Unexpected error: {e}\n")
+                # Process the request
+                print("🤔 Thinking...")
+                response = await agent.process_request(user_input)
+                print(f"\n{response}\n")
+            
+            # asyncio.run turns Ctrl-C into cancelling this task; EOF means stdin is gone
+            except (KeyboardInterrupt, asyncio.CancelledError, EOFError):
+                print("\n👋 Goodbye! Thanks for using the Hedera CLI Agent!")
+                break
+            except Exception as e:
+                print(f"❌ Unexpected error: {e}\n")
+    finally:
+        await agent.aclose()
+        await client_manager().aclose()
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    # Prefer uvloop's faster event loop when it is installed
+    use_uvloop()
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        # Python 3.10's asyncio.run raises Ctrl-C here after main has said goodbye
+        pass 
\ No newline at end of file
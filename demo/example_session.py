@@ -6,14 +6,11 @@ This shows how to integrate the Hedera Agent Kit into your own applications.
 """
 
 import asyncio
-import os
-import sys
+import logging
 from dotenv import load_dotenv
 
-# Add parent directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from hedera_agent_kit import agent_registry
+from hedera_agent_kit.client import client_manager, use_uvloop
 
 async def example_session():
     """Example of using the agent kit directly"""
@@ -53,16 +50,22 @@ async def example_session():
         
         # Example 5: Get available tools
         print("🔧 Available tools:")
-        for tool_name in agent_registry._tools.keys():
-            schema = agent_registry.get_schema(tool_name)
+        schemas = {name: agent_registry.get_schema(name) for name in agent_registry._tools}
+        for tool_name, schema in schemas.items():
             print(f"  • {tool_name}: {schema.__name__}")
         
     except Exception as e:
         print(f"❌ Error: {e}")
 
 async def main():
+    # The client manager reports its setup through logging
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     load_dotenv()
-    await example_session()
+    # Closes the pooled HTTP session when the session ends
+    async with client_manager():
+        await example_session()
 
 if __name__ == "__main__":
+    # Prefer uvloop's faster event loop when it is installed
+    use_uvloop()
     asyncio.run(main()) 
\ No newline at end of file
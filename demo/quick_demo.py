@@ -7,28 +7,32 @@ Shows both mock mode and the potential for real operations.
 """
 
 import asyncio
-import os
-import sys
+import logging
 from dotenv import load_dotenv
 
-# Add parent directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from hedera_agent_kit import agent_registry
-from hedera_agent_kit.client import client_manager
+from hedera_agent_kit.client import client_manager, use_uvloop
+from hedera_agent_kit.ui import config_status_lines
+
+_HEADER = """🌟 Hedera Agent Kit - Quick Demo
+==================================================
+📊 Current Configuration:"""
+
+_DONE = "\n✅ Demo Complete!\n\n💡 Next Steps:"
+
+_CREDENTIAL_STEPS = """   • Add real Hedera credentials to .env file to use live network
+   • Set OPERATOR_ID and OPERATOR_KEY for your testnet account"""
+
+_AGENT_STEPS = """   • Run the full CLI agent: python3 ../start_agent.py
+   • Try natural language commands with OpenAI integration"""
 
 async def run_demo():
-    print("🌟 Hedera Agent Kit - Quick Demo")
-    print("=" * 50)
-    
-    # Show current configuration
-    print(f"📊 Current Configuration:")
-    print(f"   • Network: {client_manager.network}")
-    print(f"   • SDK Available: {'✅ Yes' if hasattr(agent_registry, 'SDK_AVAILABLE') else '❓ Unknown'}")
-    print(f"   • Client Configured: {'✅ Yes' if client_manager.is_configured else '❌ No'}")
-    print(f"   • Mode: {'🌐 Live Network' if client_manager.is_configured else '🧪 Mock/Testing'}")
-    
-    print(f"\n🚀 Testing Core Operations:")
+    print("\n".join([
+        _HEADER,
+        # Show current configuration
+        *config_status_lines(client_manager()),
+        "\n🚀 Testing Core Operations:",
+    ]))
     
     # Test 1: Create Account
     print(f"\n1️⃣ Creating a new account...")
@@ -71,19 +75,20 @@ async def run_demo():
     except Exception as e:
         print(f"   ❌ Error: {e}")
     
-    print(f"\n✅ Demo Complete!")
-    print(f"\n💡 Next Steps:")
-    if not client_manager.is_configured:
-        print("   • Add real Hedera credentials to .env file to use live network")
-        print("   • Set OPERATOR_ID and OPERATOR_KEY for your testnet account")
-    print("   • Run the full CLI agent: python3 ../start_agent.py")
-    print("   • Try natural language commands with OpenAI integration")
+    if client_manager().is_configured:
+        print(f"{_DONE}\n{_AGENT_STEPS}")
+    else:
+        print(f"{_DONE}\n{_CREDENTIAL_STEPS}\n{_AGENT_STEPS}")
 
 def main():
+    # The client manager reports its setup through logging
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     load_dotenv()
     
     print("Loading Hedera Agent Kit...")
     asyncio.run(run_demo())
 
 if __name__ == "__main__":
+    # Prefer uvloop's faster event loop when it is installed
+    use_uvloop()
     main() 
\ No newline at end of file
@@ -1,13 +1,21 @@
 # hedera_agent_kit package initialization
 import os
-from dotenv import load_dotenv
+from typing import Optional
 
 __version__ = "0.1.0"
 
-# Load environment variables from .env file
-load_dotenv()
+# Hedera network configuration, read from the environment (and .env file) on first access
+_CONFIG_DEFAULTS = {
+    "HEDERA_NETWORK": "testnet",
+    "OPERATOR_ID": None,
+    "OPERATOR_KEY": None,
+}
 
-# Hedera network configuration
-HEDERA_NETWORK = os.getenv("HEDERA_NETWORK", "testnet")
-OPERATOR_ID = os.getenv("OPERATOR_ID")
-OPERATOR_KEY = os.getenv("OPERATOR_KEY") 
\ No newline at end of file
+def __getattr__(name: str) -> Optional[str]:
+    if name not in _CONFIG_DEFAULTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from dotenv import load_dotenv
+    load_dotenv()
+    value = os.getenv(name, _CONFIG_DEFAULTS[name])
+    globals()[name] = value
+    return value
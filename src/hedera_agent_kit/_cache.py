@@ -0,0 +1,98 @@
+"""
+TTL Cache
+
+Small in-process cache for read-only network lookups.
+"""
+
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional, Protocol, Tuple, cast
+
+_MISSING = object()
+
+class ErrorResult(str):
+    """A tool's error message; ttl_cached keeps these only for negative_ttl seconds"""
+    __slots__ = ()
+
+class CachedTool(Protocol):
+    """An async tool wrapped by ttl_cached, with its cache exposed for invalidation"""
+    cache: "TTLCache"
+    
+    def __call__(self, input: Any) -> Awaitable[str]: ...
+
+class TTLCache:
+    """LRU cache whose entries expire a fixed number of seconds after being stored"""
+
+    def __init__(self, ttl: float, maxsize: int = 1024, negative_ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.negative_ttl = ttl if negative_ttl is None else negative_ttl
+        self.clock = clock
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the live value for key, or default if missing or expired"""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= self.clock():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, negative: bool = False) -> None:
+        """Store value under key; negative results use the shorter negative TTL"""
+        ttl = self.negative_ttl if negative else self.ttl
+        if ttl <= 0:
+            self._data.pop(key, None)
+            return
+        self._data[key] = (self.clock() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry"""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+def ttl_cached(ttl: float, maxsize: int = 1024, negative_ttl: float = 1.0,
+               key: Optional[Callable[[Any], Optional[Hashable]]] = None
+               ) -> Callable[[Callable[[Any], Awaitable[str]]], CachedTool]:
+    """
+    Cache an async tool's results for ttl seconds.
+
+    key maps the tool input to a cache key; returning None skips the cache for that call.
+    Results the tool marks as ErrorResult are only kept for negative_ttl seconds so a
+    transient failure or a not-yet-funded account is not served stale for long.
+    The cache is exposed as the wrapper's .cache attribute for invalidation.
+    """
+    def decorator(func: Callable[[Any], Awaitable[str]]) -> CachedTool:
+        cache = TTLCache(ttl, maxsize, negative_ttl)
+
+        @functools.wraps(func)
+        async def wrapper(input: Any) -> str:
+            cache_key = key(input) if key else input
+            if cache_key is None:
+                return await func(input)
+
+            result = cache.get(cache_key, _MISSING)
+            if result is _MISSING:
+                result = await func(input)
+                cache.set(cache_key, result, negative=isinstance(result, ErrorResult))
+            return cast(str, result)
+
+        cached = cast(CachedTool, wrapper)
+        cached.cache = cache
+        return cached
+    return decorator
@@ -0,0 +1,23 @@
+"""
+Bounded Concurrency
+
+Helpers for running independent network operations side by side.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Iterable, List
+
+async def run_many(coros: Iterable[Awaitable[Any]], max_workers: int = 10) -> List[Any]:
+    """
+    Run independent operations concurrently, at most max_workers at a time.
+    
+    Results come back in input order; a failing operation yields its exception
+    instead of cancelling the rest.
+    """
+    semaphore = asyncio.Semaphore(max_workers)
+    
+    async def _run(coro: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await coro
+    
+    return await asyncio.gather(*(_run(c) for c in coros), return_exceptions=True)
@@ -0,0 +1,44 @@
+"""
+Entity ID Parsing
+
+Memoized string-to-ID parsers shared by the tool modules.
+"""
+
+import functools
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from hiero_sdk_python import AccountId, TokenId, TopicId
+
+# shard.realm.num, e.g. 0.0.12345
+_ID_RE = re.compile(r"\d+\.\d+\.\d+")
+
+# payer@seconds.nanos, or the mirror node's payer-seconds-nanos form
+_TRANSACTION_ID_RE = re.compile(r"\d+\.\d+\.\d+(@\d+\.\d+|-\d+-\d+)")
+
+def is_entity_id(value: str) -> bool:
+    """Check that a string is a well-formed shard.realm.num entity ID"""
+    return _ID_RE.fullmatch(value) is not None
+
+def is_transaction_id(value: str) -> bool:
+    """Check that a string is a well-formed transaction ID"""
+    return _TRANSACTION_ID_RE.fullmatch(value) is not None
+
+@functools.lru_cache(maxsize=4096)
+def parse_account_id(account_id: str) -> "AccountId":
+    """Parse a 0.0.x account ID string, reusing earlier results"""
+    from hiero_sdk_python import AccountId
+    return AccountId.from_string(account_id)
+
+@functools.lru_cache(maxsize=4096)
+def parse_topic_id(topic_id: str) -> "TopicId":
+    """Parse a 0.0.x topic ID string, reusing earlier results"""
+    from hiero_sdk_python import TopicId
+    return TopicId.from_string(topic_id)
+
+@functools.lru_cache(maxsize=4096)
+def parse_token_id(token_id: str) -> "TokenId":
+    """Parse a 0.0.x token ID string, reusing earlier results"""
+    from hiero_sdk_python import TokenId
+    return TokenId.from_string(token_id)
@@ -0,0 +1,47 @@
+"""
+Mirror Node Account Watcher
+
+Polls the mirror node for new transactions on watched accounts so cached
+lookups can be dropped as soon as an account changes.
+"""
+
+import asyncio
+import time
+from typing import Callable, Dict, Set
+
+from .client import client_manager, json_loads
+
+async def _poll(account_id: str, since: Dict[str, str], on_event: Callable[[str], None]) -> None:
+    """Check one account for transactions after its last seen consensus timestamp"""
+    manager = client_manager()
+    session = await manager.session()
+    params = {
+        "account.id": account_id,
+        "timestamp": f"gt:{since[account_id]}",
+        "order": "asc",
+        "limit": "25",
+    }
+    async with session.get(f"{manager.mirror_base_url}/api/v1/transactions", params=params) as response:
+        response.raise_for_status()
+        data = json_loads(await response.read())
+
+    transactions = data.get("transactions") or []
+    if transactions:
+        since[account_id] = transactions[-1]["consensus_timestamp"]
+        on_event(account_id)
+
+async def watch_accounts(account_ids: Set[str], on_event: Callable[[str], None], interval: float = 1.0) -> None:
+    """
+    Poll until cancelled, calling on_event(account_id) when a watched account has new transactions.
+
+    account_ids is re-read on every tick, so callers can add accounts while the watcher runs.
+    """
+    since: Dict[str, str] = {}
+    while True:
+        now = f"{time.time():.9f}"
+        watched = list(account_ids)
+        for account_id in watched:
+            since.setdefault(account_id, now)
+        # One failed poll (mirror node hiccup) must not stop the others
+        await asyncio.gather(*(_poll(a, since, on_event) for a in watched), return_exceptions=True)
+        await asyncio.sleep(interval)
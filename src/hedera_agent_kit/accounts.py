@@ -4,74 +4,134 @@ Hedera Account Operations
 Comprehensive account management operations using the Hedera SDK.
 """
 
+from collections import Counter
 from dataclasses import dataclass
-from typing import Optional
+from decimal import Decimal
+from typing import Any, Dict, Hashable, List, Optional, Set
 import asyncio
 
-from .client import client_manager, SDK_AVAILABLE
+from ._cache import ErrorResult, ttl_cached
+from ._concurrency import run_many
+from ._ids import is_entity_id, is_transaction_id, parse_account_id
+from ._mirror_stream import watch_accounts
+from .client import _status_name, client_manager, json_loads, SDK_AVAILABLE
 
-if SDK_AVAILABLE:
-    from hiero_sdk_python import (
-        AccountCreateTransaction, AccountId, PrivateKey, PublicKey,
-        TransferTransaction, Hbar, CryptoGetAccountBalanceQuery
-    )
+TINYBARS_PER_HBAR = 100_000_000
+
+_INVALID_ACCOUNT_ID = "❌ Error: invalid account ID '{}' (expected format 0.0.12345)"
+_INVALID_AMOUNT = "❌ Error: transfer amount must be greater than zero"
+
+# Guidance for SDK failure statuses, keyed by ResponseCode name
+_ERROR_HINTS = {
+    "INVALID_SIGNATURE": "❌ Invalid signature error - this usually means:\n"
+                         "   • The OPERATOR_KEY doesn't match the OPERATOR_ID account\n"
+                         "   • Double-check your .env file credentials\n"
+                         "   • Ensure you're using the correct private key for account {operator_id}\n"
+                         "   • Try regenerating credentials from Hedera Portal/Faucet",
+    "INSUFFICIENT_PAYER_BALANCE": "❌ Insufficient balance - account {operator_id} can't cover this transaction and its fee",
+}
+
+# Per-account balance lookups get_balances runs at once when the batch request misses
+_MAX_CONCURRENT_LOOKUPS = 10
+
+# Mirror node polls per get_receipt call, and the first wait between them
+# (doubling, capped at 8 seconds: roughly 20 seconds in all)
+_RECEIPT_ATTEMPTS = 6
+_RECEIPT_DELAY = 0.5
 
-@dataclass
+# Accounts whose balance is fetched this often get a mirror node watcher that
+# drops their cached lookups as soon as a transaction touches them
+_WATCH_AFTER_READS = 3
+_MAX_TRACKED_READS = 4096
+_balance_reads: "Counter[str]" = Counter()
+_watched_accounts: Set[str] = set()
+_watcher: Optional["asyncio.Task[None]"] = None
+
+@dataclass(slots=True, frozen=True)
 class CreateAccountInput:
     initial_balance: float = 0
     public_key: Optional[str] = None
+    # Exact amount in tinybars; takes precedence over initial_balance
+    initial_balance_tinybars: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UpdateAccountInput:
     account_id: str
     new_public_key: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DeleteAccountInput:
     account_id: str
     transfer_account_id: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TransferHbarInput:
     to_account_id: str
-    amount: float
+    amount: Optional[float] = None
     memo: Optional[str] = None
+    # Exact amount in tinybars; takes precedence over amount
+    amount_tinybars: Optional[int] = None
+    
+    def __post_init__(self) -> None:
+        if self.amount is None and self.amount_tinybars is None:
+            raise ValueError("a transfer needs amount (HBAR) or amount_tinybars")
+        if (self.amount or 0) < 0 or (self.amount_tinybars or 0) < 0:
+            raise ValueError("transfer amounts cannot be negative")
+
+@dataclass(slots=True, frozen=True)
+class GetReceiptInput:
+    transaction_id: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GetBalanceInput:
     account_id: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class GetBalancesInput:
+    account_ids: List[str]
+
+@dataclass(slots=True, frozen=True)
 class GetAccountInfoInput:
     account_id: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ApproveHbarAllowanceInput:
     spender_account_id: str
     amount: float
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ApproveTokenAllowanceInput:
     token_id: str
     spender_account_id: str
     amount: int
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SignScheduleInput:
     schedule_id: str
 
+def to_tinybars(hbar: Optional[float], tinybars: Optional[int] = None) -> int:
+    """Resolve an amount to integer tinybars, preferring the exact tinybar value"""
+    if tinybars is not None:
+        return tinybars
+    # Go through the decimal string so 0.1 HBAR is exactly 10_000_000 tinybars
+    return int(Decimal(str(hbar or 0)) * TINYBARS_PER_HBAR)
+
 async def create_account(input: CreateAccountInput) -> str:
     """Create a new Hedera account"""
     
-    if not client_manager.is_configured:
-        return f"🧪 Mock: Account created with {input.initial_balance} HBAR. ID: 0.0.123456"
+    tinybars = to_tinybars(input.initial_balance, input.initial_balance_tinybars)
+    
+    if not client_manager().is_configured:
+        return f"🧪 Mock: Account created with {_format_tinybars(tinybars)} HBAR. ID: 0.0.123456"
     
     if not SDK_AVAILABLE:
         # Mock response for development
-        return f"🧪 Mock: Account created with {input.initial_balance} HBAR. ID: 0.0.123456"
+        return f"🧪 Mock: Account created with {_format_tinybars(tinybars)} HBAR. ID: 0.0.123456"
     
     try:
-        client = client_manager.client
+        from hiero_sdk_python import AccountCreateTransaction, PrivateKey, PublicKey
+        
+        client = client_manager().client
         
         # Generate new key pair if not provided
         if input.public_key is None:
@@ -82,18 +142,15 @@ async def create_account(input: CreateAccountInput) -> str:
             private_key = None
         
         # Create account transaction
-        transaction = AccountCreateTransaction()\
-            .set_key(public_key)\
-            .set_initial_balance(Hbar(input.initial_balance))
+        transaction = AccountCreateTransaction(key=public_key, initial_balance=tinybars)
         
         # Set operator and node account IDs for proper signing
-        transaction.operator_account_id = AccountId.from_string(client_manager.operator_id)
-        node_ids = client.get_node_account_ids()
-        if node_ids:
-            transaction.node_account_id = node_ids[0]
+        transaction.operator_account_id = client_manager().operator_account_id
+        if client_manager().default_node_account_id:
+            transaction.node_account_id = client_manager().default_node_account_id
         
-        # Execute transaction - this returns a receipt directly
-        receipt = transaction.execute(client)
+        # Execute off the event loop - this returns a receipt directly
+        receipt = await asyncio.to_thread(transaction.execute, client)
         
         account_id = receipt.accountId
         
@@ -104,99 +161,276 @@ async def create_account(input: CreateAccountInput) -> str:
         return result
         
     except Exception as e:
-        error_msg = str(e)
-        if "INVALID_SIGNATURE" in error_msg or "7" in error_msg:
-            return f"❌ Invalid signature error - this usually means:\n" \
-                   f"   • The OPERATOR_KEY doesn't match the OPERATOR_ID account\n" \
-                   f"   • Double-check your .env file credentials\n" \
-                   f"   • Ensure you're using the correct private key for account {client_manager.operator_id}\n" \
-                   f"   • Try regenerating credentials from Hedera Portal/Faucet"
-        return f"❌ Error creating account: {error_msg}"
+        # PrecheckError/ReceiptStatusError carry the failing ResponseCode as .status
+        status = _status_name(e)
+        hint = _ERROR_HINTS.get(status) if status else None
+        if hint:
+            return hint.format(operator_id=client_manager().operator_id)
+        return f"❌ Error creating account: {str(e)}"
+
+async def _submit_transfer(input: TransferHbarInput, tinybars: int) -> Any:
+    """Build and submit an HBAR transfer, returning the SDK TransactionResponse"""
+    from hiero_sdk_python import TransferTransaction
+    
+    client = client_manager().client
+    operator_id = client_manager().operator_account_id
+    to_account_id = parse_account_id(input.to_account_id)
+    
+    # Create transfer transaction
+    transaction = TransferTransaction(hbar_transfers={operator_id: -tinybars, to_account_id: tinybars})
+    
+    if input.memo:
+        transaction.set_transaction_memo(input.memo)
+    
+    # Set operator and node account IDs for proper signing
+    transaction.operator_account_id = operator_id
+    if client_manager().default_node_account_id:
+        transaction.node_account_id = client_manager().default_node_account_id
+    
+    # Submit off the event loop without waiting for consensus
+    response = await asyncio.to_thread(transaction.execute, client, wait_for_receipt=False)
+    
+    # Both sides of the transfer are about to have stale cached balances
+    _invalidate_transfer(input.to_account_id)
+    
+    return response
 
 async def transfer_hbar(input: TransferHbarInput) -> str:
     """Transfer HBAR between accounts"""
     
-    if not client_manager.is_configured:
-        return f"🧪 Mock: Transferred {input.amount} HBAR to {input.to_account_id}"
+    tinybars = to_tinybars(input.amount, input.amount_tinybars)
+    amount = _format_tinybars(tinybars)
+    
+    if not client_manager().is_configured:
+        return f"🧪 Mock: Transferred {amount} HBAR to {input.to_account_id}"
     
     if not SDK_AVAILABLE:
-        return f"🧪 Mock: Transferred {input.amount} HBAR to {input.to_account_id}"
+        return f"🧪 Mock: Transferred {amount} HBAR to {input.to_account_id}"
+    
+    if not is_entity_id(input.to_account_id):
+        return _INVALID_ACCOUNT_ID.format(input.to_account_id)
+    if tinybars <= 0:
+        return _INVALID_AMOUNT
     
     try:
-        client = client_manager.client
-        operator_id = AccountId.from_string(client_manager.operator_id)
-        to_account_id = AccountId.from_string(input.to_account_id)
+        response = await _submit_transfer(input, tinybars)
         
-        # Create transfer transaction
-        transaction = TransferTransaction()\
-            .add_hbar_transfer(operator_id, Hbar(-input.amount))\
-            .add_hbar_transfer(to_account_id, Hbar(input.amount))
+        # Wait for consensus on the node we submitted to
+        await asyncio.to_thread(response.get_receipt, client_manager().client)
         
-        if input.memo:
-            transaction.set_transaction_memo(input.memo)
+        # Consensus landed, so drop anything cached while the transfer was in flight
+        _invalidate_transfer(input.to_account_id)
         
-        # Set operator and node account IDs for proper signing
-        transaction.operator_account_id = operator_id
-        node_ids = client.get_node_account_ids()
-        if node_ids:
-            transaction.node_account_id = node_ids[0]
+        return f"✅ Transferred {amount} HBAR to {input.to_account_id}. Transaction: {response.transaction_id}"
         
-        # Execute transaction - this returns a receipt directly
-        receipt = transaction.execute(client)
+    except Exception as e:
+        return f"❌ Error transferring HBAR: {str(e)}"
+
+async def submit_transfer_hbar(input: TransferHbarInput) -> str:
+    """Submit an HBAR transfer and return its transaction ID without waiting for consensus"""
+    
+    tinybars = to_tinybars(input.amount, input.amount_tinybars)
+    amount = _format_tinybars(tinybars)
+    
+    if not client_manager().is_configured or not SDK_AVAILABLE:
+        return f"🧪 Mock: Submitted transfer of {amount} HBAR to {input.to_account_id}. Transaction: 0.0.123456@1700000000.000000000"
+    
+    if not is_entity_id(input.to_account_id):
+        return _INVALID_ACCOUNT_ID.format(input.to_account_id)
+    if tinybars <= 0:
+        return _INVALID_AMOUNT
+    
+    try:
+        response = await _submit_transfer(input, tinybars)
+        return f"✅ Submitted transfer of {amount} HBAR to {input.to_account_id}. Transaction: {response.transaction_id}"
         
-        # Note: for transfers, we might want to get transaction ID differently
-        transaction_id = getattr(receipt, 'transaction_id', 'completed')
-        return f"✅ Transferred {input.amount} HBAR to {input.to_account_id}. Transaction: {transaction_id}"
+    except Exception as e:
+        return f"❌ Error submitting HBAR transfer: {str(e)}"
+
+def _mirror_transaction_id(transaction_id: str) -> str:
+    """Convert 0.0.x@secs.nanos to the mirror node's 0.0.x-secs-nanos form"""
+    account_id, _, valid_start = transaction_id.partition("@")
+    return f"{account_id}-{valid_start.replace('.', '-')}" if valid_start else transaction_id
+
+async def get_receipt(input: GetReceiptInput) -> str:
+    """Wait for a submitted transaction to reach consensus and report its status"""
+    
+    if not client_manager().is_configured or not SDK_AVAILABLE:
+        return f"🧪 Mock: Transaction {input.transaction_id} status: SUCCESS"
+    
+    # The ID is interpolated into the request URL, so reject anything malformed
+    if not is_transaction_id(input.transaction_id):
+        return f"❌ Error: invalid transaction ID '{input.transaction_id}' (expected format 0.0.12345@1700000000.000000000)"
+    
+    url = f"{client_manager().mirror_base_url}/api/v1/transactions/{_mirror_transaction_id(input.transaction_id)}"
+    try:
+        session = await client_manager().session()
+        # The mirror node trails consensus by a few seconds; back off until it appears
+        delay = _RECEIPT_DELAY
+        for attempt in range(_RECEIPT_ATTEMPTS):
+            async with session.get(url) as response:
+                if response.status != 404:
+                    response.raise_for_status()
+                    data = json_loads(await response.read())
+                    result = data["transactions"][0]["result"]
+                    if result == "SUCCESS":
+                        return f"✅ Transaction {input.transaction_id} status: {result}"
+                    return f"❌ Transaction {input.transaction_id} failed: {result}"
+            if attempt < _RECEIPT_ATTEMPTS - 1:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 8.0)
+        
+        return f"❌ Error getting receipt: transaction {input.transaction_id} not found on the mirror node yet"
         
     except Exception as e:
-        return f"❌ Error transferring HBAR: {str(e)}"
+        return f"❌ Error getting receipt: {str(e)}"
 
+def _account_cache_key(account_id: Optional[str]) -> Optional[Hashable]:
+    """Cache key for account lookups; None disables caching in mock mode"""
+    if not (account_id and client_manager().is_configured and SDK_AVAILABLE):
+        return None
+    return (account_id, client_manager().network)
+
+def _invalidate_account(account_id: str) -> None:
+    """Drop cached balance and info for an account"""
+    key = (account_id, client_manager().network)
+    get_balance.cache.invalidate(key)
+    get_account_info.cache.invalidate(key)
+
+def _invalidate_transfer(to_account_id: str) -> None:
+    """Drop cached lookups for both sides of a transfer from the operator"""
+    operator_id = client_manager().operator_id
+    if operator_id:
+        _invalidate_account(operator_id)
+    _invalidate_account(to_account_id)
+
+def _track_balance_read(account_id: str) -> None:
+    """Count a balance fetch and start watching the account once it is hot"""
+    global _watcher
+    if account_id in _watched_accounts:
+        return
+    if len(_balance_reads) >= _MAX_TRACKED_READS:
+        _balance_reads.clear()
+    _balance_reads[account_id] += 1
+    if _balance_reads[account_id] < _WATCH_AFTER_READS:
+        return
+    
+    _watched_accounts.add(account_id)
+    # A single watcher polls every hot account; restart it if its loop has gone.
+    # The client manager owns the task so aclose stops the polling.
+    if _watcher is None or _watcher.done() or _watcher.get_loop() is not asyncio.get_running_loop():
+        _watcher = client_manager().spawn(watch_accounts(_watched_accounts, _invalidate_account))
+
+def _format_tinybars(tinybars: int) -> str:
+    """Render a tinybar amount as an exact HBAR decimal string"""
+    sign = "-" if tinybars < 0 else ""
+    whole, fraction = divmod(abs(tinybars), TINYBARS_PER_HBAR)
+    return f"{sign}{whole}.{fraction:08d}".rstrip("0").rstrip(".")
+
+async def _mirror_balance(account_id: str) -> int:
+    """Fetch an account's balance in tinybars from the mirror node REST API"""
+    session = await client_manager().session()
+    url = f"{client_manager().mirror_base_url}/api/v1/accounts/{account_id}"
+    async with session.get(url, params={"transactions": "false"}) as response:
+        response.raise_for_status()
+        data = json_loads(await response.read())
+    balance: int = data["balance"]["balance"]
+    return balance
+
+@ttl_cached(ttl=5.0, maxsize=1024,
+            key=lambda i: _account_cache_key(i.account_id or client_manager().operator_id))
 async def get_balance(input: GetBalanceInput) -> str:
     """Get account balance"""
     
-    if not client_manager.is_configured:
-        account_id = input.account_id or "0.0.123456"
-        return f"🧪 Mock: Account {account_id} balance: 10.5 HBAR"
+    if not client_manager().is_configured:
+        return f"🧪 Mock: Account {input.account_id or '0.0.123456'} balance: 10.5 HBAR"
     
-    account_id = input.account_id or client_manager.operator_id
+    account_id = input.account_id or client_manager().operator_id
     if not account_id:
-        return "❌ Error: No account ID provided and no operator account configured."
+        return ErrorResult("❌ Error: No account ID provided and no operator account configured.")
     
     if not SDK_AVAILABLE:
         return f"🧪 Mock: Account {account_id} balance: 10.5 HBAR"
     
+    if not is_entity_id(account_id):
+        return ErrorResult(_INVALID_ACCOUNT_ID.format(account_id))
+    
+    _track_balance_read(account_id)
+    
+    # A single mirror node GET avoids the consensus node gRPC round-trip and retries
+    try:
+        tinybars = await _mirror_balance(account_id)
+        return f"✅ Account {account_id} balance: {_format_tinybars(tinybars)} HBAR"
+    except Exception:
+        # Mirror node unreachable or lagging - fall back to a consensus node query
+        pass
+    
     try:
-        client = client_manager.client
-        account_id_obj = AccountId.from_string(account_id)
+        from hiero_sdk_python import CryptoGetAccountBalanceQuery
+        
+        client = client_manager().client
+        account_id_obj = parse_account_id(account_id)
         
         # Create balance query
-        query = CryptoGetAccountBalanceQuery()\
-            .set_account_id(account_id_obj)
-        
-        # Execute query
-        balance = query.execute(client)
-        
-        # Convert balance to readable format
-        try:
-            # Use the correct attribute for HBAR balance
-            if hasattr(balance, 'hbars'):
-                hbar_amount = balance.hbars
-            elif hasattr(balance, 'hbar'):
-                hbar_amount = balance.hbar
-            elif hasattr(balance, 'to_hbars'):
-                hbar_amount = balance.to_hbars()
-            elif hasattr(balance, 'balance'):
-                hbar_amount = balance.balance
-            else:
-                hbar_amount = str(balance)
-            
-            return f"✅ Account {account_id} balance: {hbar_amount} HBAR"
-        except Exception as e:
-            return f"✅ Account {account_id} balance query completed (format: {type(balance).__name__})"
+        query = CryptoGetAccountBalanceQuery(account_id=account_id_obj)
+        
+        # Execute query off the event loop
+        balance = await asyncio.to_thread(query.execute, client)
+        
+        # AccountBalance.hbars is an Hbar; report it exactly like the mirror path
+        tinybars = balance.hbars.to_tinybars()
+        return f"✅ Account {account_id} balance: {_format_tinybars(tinybars)} HBAR"
         
     except Exception as e:
-        return f"❌ Error getting balance: {str(e)}"
+        return ErrorResult(f"❌ Error getting balance: {str(e)}")
+
+async def _mirror_balances(account_ids: List[str]) -> Dict[str, int]:
+    """Fetch tinybar balances for several accounts in one mirror node request"""
+    session = await client_manager().session()
+    # The balances endpoint accepts a repeated account.id filter
+    params = [("account.id", account_id) for account_id in account_ids]
+    params.append(("limit", str(min(len(account_ids), 100))))
+    async with session.get(f"{client_manager().mirror_base_url}/api/v1/balances", params=params) as response:
+        response.raise_for_status()
+        data = json_loads(await response.read())
+    return {entry["account"]: entry["balance"] for entry in data.get("balances", [])}
+
+async def get_balances(input: GetBalancesInput) -> str:
+    """Get balances for several accounts with a single round-trip"""
+    
+    if not client_manager().is_configured or not SDK_AVAILABLE:
+        return "\n".join(f"🧪 Mock: Account {account_id} balance: 10.5 HBAR" for account_id in input.account_ids)
+    
+    # Balances get_balance fetched recently are served from its cache
+    lines: Dict[str, str] = {}
+    for account_id in input.account_ids:
+        cached = get_balance.cache.get(_account_cache_key(account_id))
+        if cached is not None:
+            lines[account_id] = cached
+    
+    # Malformed IDs are left out of the batch; get_balance reports them below
+    batch = [account_id for account_id in input.account_ids if account_id not in lines and is_entity_id(account_id)]
+    try:
+        found = await _mirror_balances(batch) if batch else {}
+    except Exception:
+        found = {}
+    
+    for account_id in batch:
+        if account_id in found:
+            lines[account_id] = f"✅ Account {account_id} balance: {_format_tinybars(found[account_id])} HBAR"
+            get_balance.cache.set(_account_cache_key(account_id), lines[account_id])
+    
+    # Anything the batch request missed is looked up a few at a time
+    missing = list(dict.fromkeys(account_id for account_id in input.account_ids if account_id not in lines))
+    results = await run_many(
+        (get_balance(GetBalanceInput(account_id=account_id)) for account_id in missing),
+        max_workers=_MAX_CONCURRENT_LOOKUPS,
+    )
+    for account_id, result in zip(missing, results):
+        lines[account_id] = result if isinstance(result, str) else f"❌ Error getting balance: {result}"
+    return "\n".join(lines[account_id] for account_id in input.account_ids)
 
+@ttl_cached(ttl=5.0, maxsize=1024, key=lambda i: _account_cache_key(i.account_id))
 async def get_account_info(input: GetAccountInfoInput) -> str:
     """Get detailed account information"""
     
@@ -205,30 +439,33 @@ async def get_account_info(input: GetAccountInfoInput) -> str:
     
     # For now, return balance as account info
     balance_result = await get_balance(GetBalanceInput(account_id=input.account_id))
+    if isinstance(balance_result, ErrorResult):
+        return balance_result
     return balance_result.replace("balance:", "info - Balance:")
 
-# Placeholder implementations for other operations
-async def update_account(input: UpdateAccountInput) -> str:
+# Placeholder implementations for other operations; these never await, so they
+# are plain functions and call_tool returns their strings directly
+def update_account(input: UpdateAccountInput) -> str:
     if not SDK_AVAILABLE:
         return f"🧪 Mock: Account {input.account_id} updated with new key"
     return f"❌ Account update not yet implemented in SDK wrapper"
 
-async def delete_account(input: DeleteAccountInput) -> str:
+def delete_account(input: DeleteAccountInput) -> str:
     if not SDK_AVAILABLE:
         return f"🧪 Mock: Account {input.account_id} deleted, funds transferred to {input.transfer_account_id}"
     return f"❌ Account deletion not yet implemented in SDK wrapper"
 
-async def approve_hbar_allowance(input: ApproveHbarAllowanceInput) -> str:
+def approve_hbar_allowance(input: ApproveHbarAllowanceInput) -> str:
     if not SDK_AVAILABLE:
         return f"🧪 Mock: Approved {input.amount} HBAR allowance for {input.spender_account_id}"
     return f"❌ HBAR allowance not yet implemented in SDK wrapper"
 
-async def approve_token_allowance(input: ApproveTokenAllowanceInput) -> str:
+def approve_token_allowance(input: ApproveTokenAllowanceInput) -> str:
     if not SDK_AVAILABLE:
         return f"🧪 Mock: Approved {input.amount} token allowance for {input.spender_account_id}"
     return f"❌ Token allowance not yet implemented in SDK wrapper"
 
-async def sign_schedule(input: SignScheduleInput) -> str:
+def sign_schedule(input: SignScheduleInput) -> str:
     if not SDK_AVAILABLE:
         return f"🧪 Mock: Signed scheduled transaction {input.schedule_id}"
     return f"❌ Schedule signing not yet implemented in SDK wrapper" 
\ No newline at end of file
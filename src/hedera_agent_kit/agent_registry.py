@@ -1,14 +1,21 @@
-from typing import Type, Any
+import functools
+import inspect
+import sys
+from types import MappingProxyType
+from typing import Type, Any, Callable, Dict, FrozenSet, Tuple
 from hedera_agent_kit import accounts, tokens, consensus
 
 # Map of tool name to (input schema class, tool function)
-_tools = {
+_tools: Dict[str, Tuple[Type[Any], Callable[[Any], Any]]] = {
     # Account management tools
     "create_account": (accounts.CreateAccountInput, accounts.create_account),
     "update_account": (accounts.UpdateAccountInput, accounts.update_account),
     "delete_account": (accounts.DeleteAccountInput, accounts.delete_account),
     "transfer_hbar": (accounts.TransferHbarInput, accounts.transfer_hbar),
+    "submit_transfer_hbar": (accounts.TransferHbarInput, accounts.submit_transfer_hbar),
+    "get_receipt": (accounts.GetReceiptInput, accounts.get_receipt),
     "get_balance": (accounts.GetBalanceInput, accounts.get_balance),
+    "get_balances": (accounts.GetBalancesInput, accounts.get_balances),
     "get_account_info": (accounts.GetAccountInfoInput, accounts.get_account_info),
     "approve_hbar_allowance": (accounts.ApproveHbarAllowanceInput, accounts.approve_hbar_allowance),
     "approve_token_allowance": (accounts.ApproveTokenAllowanceInput, accounts.approve_token_allowance),
@@ -42,19 +49,42 @@ _tools = {
     "delete_topic": (consensus.DeleteTopicInput, consensus.delete_topic),
     "submit_message": (consensus.SubmitMessageInput, consensus.submit_message),
     "get_topic_info": (consensus.GetTopicInfoInput, consensus.get_topic_info),
-    "get_topic_messages": (consensus.GetTopicMessagesInput, consensus.get_topic_messages)
+    "get_topic_messages": (consensus.GetTopicMessagesInput, consensus.get_topic_messages),
 }
 
+# Read-only view of the registry; it reflects tools added through register_tool
+tools = MappingProxyType(_tools)
+# Registered names for callers that only probe membership; rebuilt by register_tool
+_tool_names: FrozenSet[str] = frozenset(_tools)
+
+def register_tool(tool_name: str, schema_cls: Type[Any], func: Callable[[Any], Any]) -> None:
+    """Add or replace a tool in the registry."""
+    global _tool_names
+    # Tool results are handed to callers as values; a generator would arrive unconsumed
+    if inspect.isasyncgenfunction(func):
+        raise TypeError(f"Tool '{tool_name}' is an async generator; register a function that returns its result")
+    # Interned like the literal keys above, so lookups can match on identity
+    _tools[sys.intern(tool_name)] = (schema_cls, func)
+    _tool_names = frozenset(_tools)
+    get_schema.cache_clear()
+
+@functools.lru_cache(maxsize=None)
 def get_schema(tool_name: str) -> Type[Any]:
     """Return the dataclass schema for the given tool name."""
-    if tool_name not in _tools:
-        raise KeyError(f"Tool '{tool_name}' not found")
-    return _tools[tool_name][0]
+    try:
+        return _tools[tool_name][0]
+    except KeyError:
+        raise KeyError(f"Tool '{tool_name}' not found") from None
 
-async def call_tool(tool_name: str, args: dict) -> Any:
+async def call_tool(tool_name: str, args: Dict[str, Any]) -> Any:
     """Instantiate the tool's input schema with args and execute the tool."""
-    if tool_name not in _tools:
+    entry = _tools.get(sys.intern(tool_name))
+    if entry is None:
         raise KeyError(f"Tool '{tool_name}' not found")
-    schema_cls, func = _tools[tool_name]
+    schema_cls, func = entry
     input_obj = schema_cls(**args)
-    return await func(input_obj) 
\ No newline at end of file
+    result = func(input_obj)
+    # Placeholder tools are plain functions; only coroutines are awaited
+    if inspect.iscoroutine(result):
+        return await result
+    return result 
\ No newline at end of file
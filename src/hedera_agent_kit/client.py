@@ -4,50 +4,104 @@ Hedera Client Manager
 Centralized client configuration and network management for the agent kit.
 """
 
+import asyncio
+import functools
+import importlib.util
+import logging
 import os
-from typing import Optional
+import sys
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, List, Optional, Set, Type
 from dotenv import load_dotenv
 
+# Mirror node responses are parsed with orjson when it is installed
+json_loads: Callable[[bytes], Any]
 try:
-    from hiero_sdk_python import Client, PrivateKey, AccountId, Network
-    SDK_AVAILABLE = True
+    import orjson
+    json_loads = orjson.loads
 except ImportError:
-    SDK_AVAILABLE = False
-    # Mock classes for development
-    class Client:
-        @classmethod
-        def for_testnet(cls): return cls()
-        @classmethod
-        def for_mainnet(cls): return cls()
-        def set_operator(self, account_id, private_key): pass
-    
-    class PrivateKey:
-        @classmethod
-        def from_string(cls, key_str): return cls()
-    
-    class AccountId:
-        @classmethod
-        def from_string(cls, id_str): return cls()
-    
-    class Network:
-        TESTNET = "testnet"
-        MAINNET = "mainnet"
-
-# Load environment variables
-load_dotenv()
+    import json
+    json_loads = json.loads
+
+# Finding the SDK is cheap; importing it is not, so that waits for _setup_client
+SDK_AVAILABLE = importlib.util.find_spec("hiero_sdk_python") is not None
+
+if TYPE_CHECKING:
+    import aiohttp
+    from hiero_sdk_python import AccountId, Client
+
+class _MockClient:
+    """Stand-in client for development without hiero-sdk-python"""
+    def set_operator(self, account_id: Any, private_key: Any) -> None: pass
+
+logger = logging.getLogger(__name__)
+
+def _status_name(exc: BaseException) -> Optional[str]:
+    """ResponseCode name carried by PrecheckError/ReceiptStatusError, if any"""
+    name = getattr(getattr(exc, "status", None), "name", None)
+    return name if isinstance(name, str) else None
+
+def _grpc_code_name(exc: BaseException) -> Optional[str]:
+    """Status code name of a grpc.RpcError, if exc is one"""
+    code = getattr(exc, "code", None)
+    name = getattr(code(), "name", None) if callable(code) else None
+    return name if isinstance(name, str) else None
+
+def is_node_failure(exc: BaseException) -> bool:
+    """Whether an SDK error points at the node itself rather than the transaction"""
+    if _status_name(exc) == "INVALID_NODE_ACCOUNT":
+        return True
+    # MaxAttemptsError: the node kept failing until the SDK gave up
+    if type(exc).__name__ == "MaxAttemptsError":
+        return True
+    # grpc.RpcError for an unreachable node
+    return _grpc_code_name(exc) == "UNAVAILABLE"
+
+# Failures worth resubmitting the same signed transaction for
+_TRANSIENT_STATUSES = frozenset({"BUSY", "PLATFORM_TRANSACTION_NOT_CREATED", "PLATFORM_NOT_ACTIVE"})
+_TRANSIENT_GRPC_CODES = frozenset({"UNAVAILABLE", "DEADLINE_EXCEEDED", "RESOURCE_EXHAUSTED"})
+
+def is_transient_failure(exc: BaseException) -> bool:
+    """Whether an SDK error is likely to clear up if the submission is retried"""
+    return _status_name(exc) in _TRANSIENT_STATUSES or _grpc_code_name(exc) in _TRANSIENT_GRPC_CODES
+
+def is_duplicate_transaction(exc: BaseException) -> bool:
+    """Whether the network rejected a submission because it already has that transaction ID"""
+    return _status_name(exc) == "DUPLICATE_TRANSACTION"
+
+# The .env file is read on first use rather than at import
+_dotenv_loaded = False
+
+# Public mirror node REST endpoints per network
+MIRROR_NODE_URLS = {
+    "mainnet": "https://mainnet-public.mirrornode.hedera.com",
+    "testnet": "https://testnet.mirrornode.hedera.com",
+    "previewnet": "https://previewnet.mirrornode.hedera.com",
+}
 
 class HederaClientManager:
     """Manages Hedera client connections and configuration"""
     
-    def __init__(self):
-        self._client: Optional[Client] = None
+    def __init__(self) -> None:
+        self._client: Optional["Client"] = None
         self._operator_id: Optional[str] = None
         self._operator_key: Optional[str] = None
         self._network: str = "testnet"
+        self._operator_account_id: Optional["AccountId"] = None
+        self._node_account_ids: List["AccountId"] = []
+        self._default_node_account_id: Optional["AccountId"] = None
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
         self._load_config()
     
-    def _load_config(self):
+    def _load_config(self) -> None:
         """Load configuration from environment variables"""
+        global _dotenv_loaded
+        if not _dotenv_loaded:
+            load_dotenv()
+            _dotenv_loaded = True
+        
         self._network = os.getenv("HEDERA_NETWORK", "testnet").lower()
         self._operator_id = os.getenv("OPERATOR_ID")
         self._operator_key = os.getenv("OPERATOR_KEY")
@@ -56,16 +110,18 @@ class HederaClientManager:
         if self._operator_id and self._operator_key and self._operator_id.strip() and self._operator_key.strip():
             self._setup_client()
         else:
-            print("⚠️  No Hedera credentials provided - running in mock mode")
+            logger.warning("No Hedera credentials provided - running in mock mode")
     
-    def _setup_client(self):
+    def _setup_client(self) -> None:
         """Set up the Hedera client with operator credentials"""
         if not SDK_AVAILABLE:
-            print("⚠️  Running in mock mode - hiero-sdk-python not available")
-            self._client = Client()
+            logger.warning("Running in mock mode - hiero-sdk-python not available")
+            self._client = _MockClient()
             return
         
         try:
+            from hiero_sdk_python import AccountId, Client, PrivateKey
+            
             # Create client (SDK will use default network configuration)
             self._client = Client()
             
@@ -74,18 +130,26 @@ class HederaClientManager:
                 operator_id = AccountId.from_string(self._operator_id)
                 operator_key = PrivateKey.from_string(self._operator_key)
                 self._client.set_operator(operator_id, operator_key)
+                # Parsed once here; every transaction reuses it
+                self._operator_account_id = operator_id
+                
+                # Resolve the target node once instead of on every transaction
+                self._node_account_ids = list(self._client.get_node_account_ids())
+                self._default_node_account_id = self._node_account_ids[0] if self._node_account_ids else None
                 
-                print(f"✅ Hedera client initialized for {self._network}")
-                print(f"   Operator: {self._operator_id}")
+                logger.info("Hedera client initialized for %s (operator %s)", self._network, self._operator_id)
             else:
-                print("⚠️  No operator credentials provided - some operations may fail")
+                logger.warning("No operator credentials provided - some operations may fail")
                 
         except Exception as e:
-            print(f"❌ Failed to initialize Hedera client: {e}")
+            logger.error("Failed to initialize Hedera client: %s", e)
             self._client = None
+            self._operator_account_id = None
+            self._node_account_ids = []
+            self._default_node_account_id = None
     
     @property
-    def client(self) -> Optional[Client]:
+    def client(self) -> Optional["Client"]:
         """Get the configured Hedera client"""
         return self._client
     
@@ -104,9 +168,84 @@ class HederaClientManager:
         """Get the operator account ID"""
         return self._operator_id
     
+    @property
+    def operator_account_id(self) -> Optional["AccountId"]:
+        """Get the parsed operator AccountId"""
+        return self._operator_account_id
+    
+    @property
+    def default_node_account_id(self) -> Optional["AccountId"]:
+        """Get the node account ID transactions are submitted to"""
+        return self._default_node_account_id
+    
+    def rotate_node(self, failed: Optional["AccountId"] = None) -> Optional["AccountId"]:
+        """
+        Move transactions on to the next node after the current one failed.
+        
+        The choice sticks until the next failure, so every transaction goes to a
+        single known-good node instead of being fanned out across the network.
+        Passing the failed node makes concurrent reports of one outage rotate only once.
+        """
+        if not self._node_account_ids:
+            return self._default_node_account_id
+        if failed is not None and failed != self._default_node_account_id:
+            return self._default_node_account_id
+        try:
+            index = self._node_account_ids.index(self._default_node_account_id)
+        except ValueError:
+            index = -1
+        self._default_node_account_id = self._node_account_ids[(index + 1) % len(self._node_account_ids)]
+        logger.warning("Switching to node %s", self._default_node_account_id)
+        return self._default_node_account_id
+    
+    @property
+    def mirror_base_url(self) -> str:
+        """Get the mirror node REST base URL for the current network"""
+        return MIRROR_NODE_URLS.get(self._network, MIRROR_NODE_URLS["testnet"])
+    
+    async def session(self) -> "aiohttp.ClientSession":
+        """Get the shared, connection-pooled aiohttp session for REST calls"""
+        loop = asyncio.get_running_loop()
+        # Sessions are bound to the loop that created them
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            import aiohttp
+            # Keep-alive pool so concurrent lookups reuse TCP/TLS connections
+            connector = aiohttp.TCPConnector(limit=64, ttl_dns_cache=300, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._session_loop = loop
+        return self._session
+    
+    def spawn(self, coro: Coroutine[Any, Any, None]) -> "asyncio.Task[None]":
+        """Run a background coroutine that aclose will cancel"""
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+    
+    async def aclose(self) -> None:
+        """Cancel background tasks and close the shared HTTP session"""
+        loop = asyncio.get_running_loop()
+        # Tasks left on another loop died with it and cannot be cancelled from here
+        tasks = [task for task in self._tasks if task.get_loop() is loop]
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+    
+    async def __aenter__(self) -> "HederaClientManager":
+        return self
+    
+    async def __aexit__(self, exc_type: Optional[Type[BaseException]], exc: Optional[BaseException],
+                        tb: Optional[TracebackType]) -> None:
+        await self.aclose()
+    
     def update_config(self, network: Optional[str] = None, 
                      operator_id: Optional[str] = None, 
-                     operator_key: Optional[str] = None):
+                     operator_key: Optional[str] = None) -> None:
         """Update client configuration"""
         if network:
             self._network = network
@@ -117,5 +256,19 @@ class HederaClientManager:
         
         self._setup_client()
 
-# Global client manager instance
-client_manager = HederaClientManager() 
\ No newline at end of file
+def use_uvloop() -> bool:
+    """Switch asyncio to uvloop's event loop when it is installed; call before asyncio.run"""
+    if sys.platform == "win32":
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+@functools.lru_cache(maxsize=1)
+def client_manager() -> HederaClientManager:
+    """Get the shared client manager, configuring it on first use"""
+    return HederaClientManager()
+ 
\ No newline at end of file
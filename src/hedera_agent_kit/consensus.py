@@ -5,72 +5,79 @@ Comprehensive consensus service operations using the Hedera SDK.
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import AsyncGenerator, Hashable, Optional
 import asyncio
+import base64
+import contextlib
 
-from .client import client_manager, SDK_AVAILABLE
+from ._cache import ErrorResult, ttl_cached
+from ._ids import is_entity_id, parse_topic_id
+from .client import client_manager, json_loads, SDK_AVAILABLE
 
-if SDK_AVAILABLE:
-    from hiero_sdk_python import (
-        TopicCreateTransaction, TopicDeleteTransaction, TopicUpdateTransaction,
-        TopicMessageSubmitTransaction, TopicInfoQuery, TopicMessageQuery,
-        TopicId, AccountId
-    )
+# Largest message the SDK will split across chunks (20 chunks x 1024 bytes)
+MAX_MESSAGE_BYTES = 20 * 1024
 
-@dataclass
+_INVALID_TOPIC_ID = "❌ Error: invalid topic ID '{}' (expected format 0.0.12345)"
+
+# Mirror node page size for topic message streaming (the REST API maximum)
+_PAGE_SIZE = 100
+
+@dataclass(slots=True, frozen=True)
 class CreateTopicInput:
     memo: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UpdateTopicInput:
     topic_id: str
     memo: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DeleteTopicInput:
     topic_id: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SubmitMessageInput:
     topic_id: str
     message: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GetTopicInfoInput:
     topic_id: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GetTopicMessagesInput:
     topic_id: str
     limit: Optional[int] = None
+    
+    def __post_init__(self) -> None:
+        # 0 would fall back to a full page and a negative value would reach the mirror node URL
+        if self.limit is not None and self.limit <= 0:
+            raise ValueError(f"limit must be positive, got {self.limit}")
 
 async def create_topic(input: CreateTopicInput) -> str:
     """Create a new consensus topic"""
     
-    if not client_manager.is_configured:
+    if not client_manager().is_configured:
         return f"🧪 Mock: Topic created with memo '{input.memo or 'none'}', ID: 0.0.345678"
     
     if not SDK_AVAILABLE:
         return f"🧪 Mock: Topic created with memo '{input.memo or 'none'}', ID: 0.0.345678"
     
     try:
-        client = client_manager.client
+        from hiero_sdk_python import TopicCreateTransaction
         
-        # Create topic transaction
-        transaction = TopicCreateTransaction()
+        client = client_manager().client
         
-        if input.memo:
-            transaction.set_memo(input.memo)
+        # Create topic transaction
+        transaction = TopicCreateTransaction(memo=input.memo)
         
         # Set operator and node account IDs for proper signing
-        operator_id = AccountId.from_string(client_manager.operator_id)
-        transaction.operator_account_id = operator_id
-        node_ids = client.get_node_account_ids()
-        if node_ids:
-            transaction.node_account_id = node_ids[0]
+        transaction.operator_account_id = client_manager().operator_account_id
+        if client_manager().default_node_account_id:
+            transaction.node_account_id = client_manager().default_node_account_id
         
-        # Execute transaction
-        receipt = transaction.execute(client)
+        # Execute transaction off the event loop
+        receipt = await asyncio.to_thread(transaction.execute, client)
         
         
         topic_id = receipt.topicId
@@ -83,23 +90,26 @@ async def create_topic(input: CreateTopicInput) -> str:
 async def update_topic(input: UpdateTopicInput) -> str:
     """Update a consensus topic"""
     
-    if not client_manager.is_configured:
+    if not client_manager().is_configured:
         return "❌ Error: Hedera client not configured. Please set OPERATOR_ID and OPERATOR_KEY."
     
     if not SDK_AVAILABLE:
         return f"🧪 Mock: Topic {input.topic_id} updated with memo '{input.memo}'"
     
+    if not is_entity_id(input.topic_id):
+        return _INVALID_TOPIC_ID.format(input.topic_id)
+    
     try:
-        client = client_manager.client
-        topic_id = TopicId.from_string(input.topic_id)
+        from hiero_sdk_python import TopicUpdateTransaction
+        
+        client = client_manager().client
+        topic_id = parse_topic_id(input.topic_id)
         
         # Create update transaction
-        transaction = TopicUpdateTransaction()\
-            .set_topic_id(topic_id)\
-            .set_memo(input.memo)
+        transaction = TopicUpdateTransaction(topic_id=topic_id, memo=input.memo)
         
-        # Execute transaction
-        receipt = transaction.execute(client)
+        # Execute transaction off the event loop
+        receipt = await asyncio.to_thread(transaction.execute, client)
         
         
         return f"✅ Topic {input.topic_id} updated with memo '{input.memo}'"
@@ -110,22 +120,26 @@ async def update_topic(input: UpdateTopicInput) -> str:
 async def delete_topic(input: DeleteTopicInput) -> str:
     """Delete a consensus topic"""
     
-    if not client_manager.is_configured:
+    if not client_manager().is_configured:
         return "❌ Error: Hedera client not configured. Please set OPERATOR_ID and OPERATOR_KEY."
     
     if not SDK_AVAILABLE:
         return f"🧪 Mock: Topic {input.topic_id} deleted"
     
+    if not is_entity_id(input.topic_id):
+        return _INVALID_TOPIC_ID.format(input.topic_id)
+    
     try:
-        client = client_manager.client
-        topic_id = TopicId.from_string(input.topic_id)
+        from hiero_sdk_python import TopicDeleteTransaction
+        
+        client = client_manager().client
+        topic_id = parse_topic_id(input.topic_id)
         
         # Create delete transaction
-        transaction = TopicDeleteTransaction()\
-            .set_topic_id(topic_id)
+        transaction = TopicDeleteTransaction(topic_id=topic_id)
         
-        # Execute transaction
-        receipt = transaction.execute(client)
+        # Execute transaction off the event loop
+        receipt = await asyncio.to_thread(transaction.execute, client)
         
         
         return f"✅ Topic {input.topic_id} deleted"
@@ -136,49 +150,71 @@ async def delete_topic(input: DeleteTopicInput) -> str:
 async def submit_message(input: SubmitMessageInput) -> str:
     """Submit a message to a consensus topic"""
     
-    if not client_manager.is_configured:
+    if not client_manager().is_configured:
         return "❌ Error: Hedera client not configured. Please set OPERATOR_ID and OPERATOR_KEY."
     
     if not SDK_AVAILABLE:
         return f"🧪 Mock: Message '{input.message}' submitted to topic {input.topic_id}"
     
+    if not is_entity_id(input.topic_id):
+        return _INVALID_TOPIC_ID.format(input.topic_id)
+    
+    # Oversized messages are rejected here rather than after a network round-trip
+    payload = input.message.encode('utf-8')
+    if len(payload) > MAX_MESSAGE_BYTES:
+        return f"❌ Error submitting message: {len(payload)} bytes exceeds the {MAX_MESSAGE_BYTES} byte limit"
+    
     try:
-        client = client_manager.client
-        topic_id = TopicId.from_string(input.topic_id)
+        from hiero_sdk_python import TopicMessageSubmitTransaction
+        
+        client = client_manager().client
+        topic_id = parse_topic_id(input.topic_id)
         
         # Create message submit transaction
-        transaction = TopicMessageSubmitTransaction()\
-            .set_topic_id(topic_id)\
-            .set_message(input.message.encode('utf-8'))
+        transaction = TopicMessageSubmitTransaction(topic_id=topic_id, message=payload)
         
-        # Execute transaction
-        receipt = transaction.execute(client)
+        # Execute transaction off the event loop
+        receipt = await asyncio.to_thread(transaction.execute, client)
         
+        # The topic's sequence number just moved on
+        get_topic_info.cache.invalidate((input.topic_id, client_manager().network))
         
-        return f"✅ Message submitted to topic {input.topic_id}. Transaction: {response.transaction_id}"
+        return f"✅ Message submitted to topic {input.topic_id}. Transaction: {receipt.transaction_id}"
         
     except Exception as e:
         return f"❌ Error submitting message: {str(e)}"
 
+def _topic_cache_key(input: GetTopicInfoInput) -> Optional[Hashable]:
+    """Cache key for topic lookups; None disables caching in mock mode"""
+    if not (client_manager().is_configured and SDK_AVAILABLE):
+        return None
+    return (input.topic_id, client_manager().network)
+
+@ttl_cached(ttl=5.0, maxsize=1024, key=_topic_cache_key)
 async def get_topic_info(input: GetTopicInfoInput) -> str:
     """Get information about a consensus topic"""
     
-    if not client_manager.is_configured:
-        return "❌ Error: Hedera client not configured. Please set OPERATOR_ID and OPERATOR_KEY."
+    if not client_manager().is_configured:
+        return ErrorResult("❌ Error: Hedera client not configured. Please set OPERATOR_ID and OPERATOR_KEY.")
     
     if not SDK_AVAILABLE:
         return f"🧪 Mock: Topic {input.topic_id} - memo: 'mock_memo', sequence: 42"
     
+    if not is_entity_id(input.topic_id):
+        return ErrorResult(_INVALID_TOPIC_ID.format(input.topic_id))
+    
     try:
-        client = client_manager.client
-        topic_id = TopicId.from_string(input.topic_id)
+        from hiero_sdk_python import TopicInfoQuery
+        
+        client = client_manager().client
+        topic_id = parse_topic_id(input.topic_id)
         
         # Create topic info query
         query = TopicInfoQuery()\
             .set_topic_id(topic_id)
         
-        # Execute query
-        info = query.execute(client)
+        # Execute query off the event loop
+        info = await asyncio.to_thread(query.execute, client)
         
         memo = getattr(info, 'topic_memo', 'No memo')
         sequence = getattr(info, 'sequence_number', 0)
@@ -186,38 +222,74 @@ async def get_topic_info(input: GetTopicInfoInput) -> str:
         return f"✅ Topic {input.topic_id}: memo='{memo}', messages={sequence}"
         
     except Exception as e:
-        return f"❌ Error getting topic info: {str(e)}"
+        return ErrorResult(f"❌ Error getting topic info: {str(e)}")
+
+async def stream_topic_messages(input: GetTopicMessagesInput) -> AsyncGenerator[str, None]:
+    """
+    Yield a topic's messages one at a time, following mirror node pagination.
+    
+    This is for library callers; get_topic_messages collects it into a tool result.
+    """
+    
+    if not client_manager().is_configured:
+        raise RuntimeError("Hedera client not configured. Please set OPERATOR_ID and OPERATOR_KEY.")
+    
+    if not SDK_AVAILABLE:
+        for n in range(1, (input.limit or 3) + 1):
+            yield f"🧪 Mock: msg{n}"
+        return
+    
+    # The ID is interpolated into the request URL, so reject anything malformed
+    if not is_entity_id(input.topic_id):
+        raise ValueError(f"invalid topic ID '{input.topic_id}' (expected format 0.0.12345)")
+    
+    manager = client_manager()
+    session = await manager.session()
+    page_size = min(input.limit or _PAGE_SIZE, _PAGE_SIZE)
+    url: Optional[str] = f"{manager.mirror_base_url}/api/v1/topics/{input.topic_id}/messages?limit={page_size}"
+    remaining = input.limit
+    
+    # Only one page is held in memory at a time
+    while url:
+        async with session.get(url) as response:
+            response.raise_for_status()
+            data = json_loads(await response.read())
+        
+        for entry in data.get("messages", []):
+            yield base64.b64decode(entry["message"]).decode("utf-8", errors="replace")
+            if remaining is not None:
+                remaining -= 1
+                if remaining <= 0:
+                    return
+        
+        next_link = (data.get("links") or {}).get("next")
+        url = f"{manager.mirror_base_url}{next_link}" if next_link else None
 
 async def get_topic_messages(input: GetTopicMessagesInput) -> str:
     """Get messages from a consensus topic"""
     
-    if not client_manager.is_configured:
+    if not client_manager().is_configured:
         return "❌ Error: Hedera client not configured. Please set OPERATOR_ID and OPERATOR_KEY."
     
     if not SDK_AVAILABLE:
         return f"🧪 Mock: Found {input.limit or 3} messages in topic {input.topic_id}: [msg1, msg2, msg3]"
     
+    if not is_entity_id(input.topic_id):
+        return _INVALID_TOPIC_ID.format(input.topic_id)
+    
     try:
-        client = client_manager.client
-        topic_id = TopicId.from_string(input.topic_id)
-        
-        # Create topic message query
-        query = TopicMessageQuery()\
-            .set_topic_id(topic_id)
-        
-        if input.limit:
-            query.set_limit(input.limit)
-        
-        # Note: This is a simplified implementation
-        # Real message querying requires handling streaming responses
-        messages = query.execute(client)
-        
-        if not messages:
+        limit = input.limit or 10
+        message_list = []
+        async with contextlib.aclosing(stream_topic_messages(input)) as messages:
+            async for message in messages:
+                message_list.append(message)
+                if len(message_list) >= limit:
+                    break
+        
+        if not message_list:
             return f"✅ No messages found for topic {input.topic_id}"
         
-        # Format messages for display
-        message_list = [str(msg) for msg in messages[:input.limit if input.limit else 10]]
         return f"✅ Messages from topic {input.topic_id}: {message_list}"
         
     except Exception as e:
-        return f"❌ Error getting topic messages: {str(e)}" 
\ No newline at end of file
+        return f"❌ Error getting topic messages: {str(e)}"
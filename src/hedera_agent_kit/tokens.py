@@ -4,20 +4,32 @@ Hedera Token Operations
 Comprehensive token management operations using the Hedera SDK.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, fields
+from typing import (
+    TYPE_CHECKING, Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Tuple, TypeVar, cast,
+)
 import asyncio
+import functools
 
-from .client import client_manager, SDK_AVAILABLE
+from ._cache import ErrorResult, ttl_cached
+from ._concurrency import run_many as run_many  # re-exported: callers batch token operations with it
+from ._ids import parse_account_id, parse_token_id
+from .client import (
+    client_manager, is_duplicate_transaction, is_node_failure, is_transient_failure, SDK_AVAILABLE,
+)
 
-if SDK_AVAILABLE:
-    from hiero_sdk_python import (
-        TokenCreateTransaction, TokenDeleteTransaction, TokenMintTransaction,
-        TokenAssociateTransaction, TokenDissociateTransaction, TokenFreezeTransaction,
-        TokenId, AccountId, Hbar, PublicKey, PrivateKey
-    )
+if TYPE_CHECKING:
+    from hiero_sdk_python import BatchTransaction
 
-@dataclass
+# HIP-551 caps an atomic batch at 50 inner transactions
+MAX_BATCH_SIZE = 50
+
+# Seconds before the first resubmission; doubled after each transient failure
+_RETRY_DELAY = 0.5
+
+_Tool = TypeVar("_Tool", bound=Callable[[Any], Awaitable[str]])
+
+@dataclass(slots=True, frozen=True)
 class CreateFungibleTokenInput:
     name: str
     symbol: str
@@ -25,378 +37,556 @@ class CreateFungibleTokenInput:
     decimals: int
     treasury_account_id: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CreateNonFungibleTokenInput:
     name: str
     symbol: str
     treasury_account_id: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UpdateTokenInput:
     token_id: str
     name: Optional[str] = None
     symbol: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DeleteTokenInput:
     token_id: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MintTokenInput:
     token_id: str
     amount: int
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MintNftInput:
     token_id: str
     metadata: List[bytes]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BurnTokenInput:
     token_id: str
     amount: int
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BurnNftInput:
     token_id: str
     serial_numbers: List[int]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TransferTokenInput:
     token_id: str
     to_account_id: str
     amount: float
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TransferNftInput:
     token_id: str
     to_account_id: str
     serial_number: int
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssociateTokenInput:
     account_id: str
     token_id: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DissociateTokenInput:
     account_id: str
     token_id: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FreezeTokenAccountInput:
     token_id: str
     account_id: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UnfreezeTokenAccountInput:
     token_id: str
     account_id: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GrantKycInput:
     token_id: str
     account_id: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RevokeKycInput:
     token_id: str
     account_id: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PauseTokenInput:
     token_id: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UnpauseTokenInput:
     token_id: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WipeTokenAccountInput:
     token_id: str
     account_id: str
     amount: float
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WipeTokenAccountNftInput:
     token_id: str
     account_id: str
     serial_numbers: List[int]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TokenAirdropInput:
     token_id: str
-    recipients: List[tuple]  # list of (account_id, amount) pairs
-
-@dataclass
+    account_ids: Tuple[str, ...]
+    amounts: Tuple[int, ...]  # amounts[i] goes to account_ids[i]
+    
+    def __post_init__(self) -> None:
+        # Tool calls arrive as JSON lists; store tuples so the input stays hashable
+        object.__setattr__(self, "account_ids", tuple(self.account_ids))
+        object.__setattr__(self, "amounts", tuple(self.amounts))
+        if len(self.account_ids) != len(self.amounts):
+            raise ValueError(f"{len(self.account_ids)} account IDs but {len(self.amounts)} amounts")
+        # Amounts come from LLM-supplied JSON, so check them here rather than mid-airdrop
+        for amount in self.amounts:
+            if isinstance(amount, bool) or not isinstance(amount, int):
+                raise TypeError(f"airdrop amounts must be integers, got {amount!r}")
+            if amount <= 0:
+                raise ValueError(f"airdrop amounts must be positive, got {amount}")
+
+@dataclass(slots=True, frozen=True)
 class GetTokenInfoInput:
     token_id: str
 
+# Live-mode success responses
+_TMPL_CREATE_FT = "✅ Fungible token created: {name} ({symbol}), ID: {token_id}, Initial supply: {supply}"
+_TMPL_CREATE_NFT = "✅ NFT created: {name} ({symbol}), ID: {token_id}"
+_TMPL_ASSOCIATE = "✅ Associated account {account_id} with token {token_id}"
+_TMPL_DISSOCIATE = "✅ Dissociated account {account_id} from token {token_id}"
+_TMPL_DELETE = "✅ Token {token_id} deleted"
+_TMPL_AIRDROP = "✅ Airdropped {total} of token {token_id} to {count} account(s) in {batches} batch(es)"
+
+# Mock-mode responses, filled from the input fields
+_MOCK_TEMPLATES = {
+    "create_fungible_token": "🧪 Mock: Fungible token created - {name} ({symbol}), ID: 0.0.789012",
+    "create_non_fungible_token": "🧪 Mock: NFT created - {name} ({symbol}), ID: 0.0.789013",
+    "associate_token": "🧪 Mock: Associated account {account_id} with token {token_id}",
+    "dissociate_token": "🧪 Mock: Dissociated account {account_id} from token {token_id}",
+    "delete_token": "🧪 Mock: Token {token_id} deleted",
+    "update_token": "🧪 Mock: Token {token_id} updated",
+    "mint_token": "🧪 Mock: Minted {amount} units to token {token_id}",
+    "mint_nft": "🧪 Mock: Minted {count} NFT(s) for token {token_id}",
+    "burn_token": "🧪 Mock: Burned {amount} units from token {token_id}",
+    "burn_nft": "🧪 Mock: Burned {count} NFT(s) of token {token_id}",
+    "transfer_token": "🧪 Mock: Transferred {amount} of token {token_id} to {to_account_id}",
+    "transfer_nft": "🧪 Mock: Transferred NFT {token_id}#{serial_number} to {to_account_id}",
+    "freeze_token_account": "🧪 Mock: Frozen account {account_id} on token {token_id}",
+    "unfreeze_token_account": "🧪 Mock: Unfrozen account {account_id} on token {token_id}",
+    "grant_kyc": "🧪 Mock: Granted KYC for account {account_id} on token {token_id}",
+    "revoke_kyc": "🧪 Mock: Revoked KYC for account {account_id} on token {token_id}",
+    "pause_token": "🧪 Mock: Paused token {token_id}",
+    "unpause_token": "🧪 Mock: Unpaused token {token_id}",
+    "wipe_token_account": "🧪 Mock: Wiped {amount} tokens of {token_id} from account {account_id}",
+    "wipe_token_account_nft": "🧪 Mock: Wiped NFT serials {serial_numbers} of token {token_id} from account {account_id}",
+    "token_airdrop": "🧪 Mock: Airdropped token {token_id} to accounts: {results}",
+    "get_token_info": "🧪 Mock: Token {token_id}: MOCK (MockToken), total supply 10000",
+}
+
+# Template values that are derived from the input rather than copied from a field
+_MOCK_EXTRAS: Dict[str, Callable[[Any], Dict[str, Any]]] = {
+    "mint_nft": lambda input: {"count": len(input.metadata)},
+    "burn_nft": lambda input: {"count": len(input.serial_numbers)},
+    "token_airdrop": lambda input: {
+        "results": ", ".join(f"{acct} (+{amount})" for acct, amount in zip(input.account_ids, input.amounts))
+    },
+}
+
+def _mock(name: str, input: Any) -> str:
+    """Render the mock-mode response for a tool"""
+    values = {f.name: getattr(input, f.name) for f in fields(input)}
+    if name in _MOCK_EXTRAS:
+        values.update(_MOCK_EXTRAS[name](input))
+    return _MOCK_TEMPLATES[name].format(**values)
+
+def _sdk_or_mock(name: str, require_config: bool = True) -> Callable[[_Tool], _Tool]:
+    """
+    Bind the real implementation when the SDK is installed, or its mock response otherwise.
+    
+    SDK_AVAILABLE is fixed at import, so the choice is made once here instead of on every call.
+    """
+    def decorate(func: _Tool) -> _Tool:
+        if SDK_AVAILABLE:
+            return func
+        
+        @functools.wraps(func)
+        async def mock(input: Any) -> str:
+            if require_config and not client_manager().is_configured:
+                return "❌ Error: Hedera client not configured. Please set OPERATOR_ID and OPERATOR_KEY."
+            return _mock(name, input)
+        return cast(_Tool, mock)
+    return decorate
+
+def _for_operator(transaction: Any) -> Any:
+    """Stamp the cached operator and node account IDs onto a transaction for signing"""
+    manager = client_manager()
+    transaction.operator_account_id = manager.operator_account_id
+    if manager.default_node_account_id:
+        transaction.node_account_id = manager.default_node_account_id
+    return transaction
+
+async def _receipt_for(transaction_id: Any) -> Any:
+    """Fetch the receipt of a transaction the network has already accepted"""
+    from hiero_sdk_python import TransactionGetReceiptQuery
+    
+    query = TransactionGetReceiptQuery().set_transaction_id(transaction_id)
+    return await asyncio.to_thread(query.execute, client_manager().client)
+
+async def _execute_with_retry(transaction: Any, attempts: int = 3) -> Any:
+    """
+    Freeze and sign once, then submit off the event loop, retrying transient failures.
+    
+    Retries resend the same signed bytes, so they carry the same transaction ID.
+    If an attempt that timed out did reach the network, the resend is rejected as
+    DUPLICATE_TRANSACTION; the original's receipt is fetched and returned instead.
+    A node that is still failing at the end is rotated out.
+    """
+    client = client_manager().client
+    if client is None:
+        raise RuntimeError("Hedera client not configured")
+    
+    def prepare() -> None:
+        transaction.freeze_with(client)
+        transaction.sign(client.operator_private_key)
+    
+    await asyncio.to_thread(prepare)
+    
+    delay = _RETRY_DELAY
+    for attempt in range(1, attempts + 1):
+        try:
+            return await asyncio.to_thread(transaction.execute, client)
+        except Exception as e:
+            if attempt > 1 and is_duplicate_transaction(e):
+                return await _receipt_for(transaction.transaction_id)
+            if attempt < attempts and is_transient_failure(e):
+                await asyncio.sleep(delay)
+                delay *= 2
+                continue
+            if is_node_failure(e):
+                client_manager().rotate_node(failed=transaction.node_account_id)
+            raise
+    raise ValueError(f"attempts must be at least 1, got {attempts}")
+
+def _new_token_create_tx(name: str, symbol: str, treasury_account_id: Optional[str],
+                         decimals: Optional[int] = None, initial_supply: Optional[int] = None) -> Any:
+    """Token create transaction; the treasury defaults to the operator"""
+    from hiero_sdk_python import TokenCreateTransaction
+    
+    treasury_id = parse_account_id(treasury_account_id) if treasury_account_id else client_manager().operator_account_id
+    transaction = TokenCreateTransaction()\
+        .set_token_name(name)\
+        .set_token_symbol(symbol)\
+        .set_treasury_account_id(treasury_id)
+    if decimals is not None:
+        transaction.set_decimals(decimals)
+    if initial_supply is not None:
+        transaction.set_initial_supply(initial_supply)
+    return _for_operator(transaction)
+
+def _new_associate_tx(account_id: str, token_id: str) -> Any:
+    from hiero_sdk_python import TokenAssociateTransaction
+    
+    transaction = TokenAssociateTransaction()\
+        .set_account_id(parse_account_id(account_id))\
+        .add_token_id(parse_token_id(token_id))
+    return _for_operator(transaction)
+
+def _new_dissociate_tx(account_id: str, token_id: str) -> Any:
+    from hiero_sdk_python import TokenDissociateTransaction
+    
+    transaction = TokenDissociateTransaction()\
+        .set_account_id(parse_account_id(account_id))\
+        .add_token_id(parse_token_id(token_id))
+    return _for_operator(transaction)
+
+def _new_delete_tx(token_id: str) -> Any:
+    from hiero_sdk_python import TokenDeleteTransaction
+    
+    transaction = TokenDeleteTransaction()\
+        .set_token_id(parse_token_id(token_id))
+    return _for_operator(transaction)
+
+@_sdk_or_mock("create_fungible_token", require_config=False)
 async def create_fungible_token(input: CreateFungibleTokenInput) -> str:
     """Create a new fungible token"""
     
-    if not client_manager.is_configured:
-        return f"🧪 Mock: Fungible token created - {input.name} ({input.symbol}), ID: 0.0.789012"
-    
-    if not SDK_AVAILABLE:
+    if not client_manager().is_configured:
         return f"🧪 Mock: Fungible token created - {input.name} ({input.symbol}), ID: 0.0.789012"
     
     try:
-        client = client_manager.client
-        operator_id = AccountId.from_string(client_manager.operator_id)
-        
-        # Use treasury account if provided, otherwise use operator
-        treasury_id = AccountId.from_string(input.treasury_account_id) if input.treasury_account_id else operator_id
-        
         # Create token transaction
-        transaction = TokenCreateTransaction()\
-            .set_token_name(input.name)\
-            .set_token_symbol(input.symbol)\
-            .set_decimals(input.decimals)\
-            .set_initial_supply(input.initial_supply)\
-            .set_treasury_account_id(treasury_id)
-        
-        # Set operator and node account IDs for proper signing
-        transaction.operator_account_id = operator_id
-        node_ids = client.get_node_account_ids()
-        if node_ids:
-            transaction.node_account_id = node_ids[0]
+        transaction = _new_token_create_tx(
+            input.name, input.symbol, input.treasury_account_id,
+            decimals=input.decimals, initial_supply=input.initial_supply,
+        )
         
-        # Execute transaction
-        receipt = transaction.execute(client)
+        # Execute transaction, retrying transient failures
+        receipt = await _execute_with_retry(transaction)
         
         
         token_id = receipt.tokenId
         
-        return f"✅ Fungible token created: {input.name} ({input.symbol}), ID: {token_id}, Initial supply: {input.initial_supply}"
+        return _TMPL_CREATE_FT.format(name=input.name, symbol=input.symbol, token_id=token_id, supply=input.initial_supply)
         
     except Exception as e:
         return f"❌ Error creating fungible token: {str(e)}"
 
+@_sdk_or_mock("create_non_fungible_token")
 async def create_non_fungible_token(input: CreateNonFungibleTokenInput) -> str:
     """Create a new NFT"""
     
-    if not client_manager.is_configured:
+    if not client_manager().is_configured:
         return "❌ Error: Hedera client not configured. Please set OPERATOR_ID and OPERATOR_KEY."
     
-    if not SDK_AVAILABLE:
-        return f"🧪 Mock: NFT created - {input.name} ({input.symbol}), ID: 0.0.789013"
-    
     try:
-        client = client_manager.client
-        operator_id = AccountId.from_string(client_manager.operator_id)
-        
-        # Use treasury account if provided, otherwise use operator
-        treasury_id = AccountId.from_string(input.treasury_account_id) if input.treasury_account_id else operator_id
-        
         # Create NFT transaction
-        transaction = TokenCreateTransaction()\
-            .set_token_name(input.name)\
-            .set_token_symbol(input.symbol)\
-            .set_treasury_account_id(treasury_id)
+        transaction = _new_token_create_tx(input.name, input.symbol, input.treasury_account_id)
         # Note: NFT configuration may require additional setup
         
-        # Set operator and node account IDs for proper signing
-        transaction.operator_account_id = operator_id
-        node_ids = client.get_node_account_ids()
-        if node_ids:
-            transaction.node_account_id = node_ids[0]
-        
-        # Execute transaction
-        receipt = transaction.execute(client)
+        # Execute transaction, retrying transient failures
+        receipt = await _execute_with_retry(transaction)
         
         
         token_id = receipt.tokenId
         
-        return f"✅ NFT created: {input.name} ({input.symbol}), ID: {token_id}"
+        return _TMPL_CREATE_NFT.format(name=input.name, symbol=input.symbol, token_id=token_id)
         
     except Exception as e:
         return f"❌ Error creating NFT: {str(e)}"
 
+@_sdk_or_mock("associate_token")
 async def associate_token(input: AssociateTokenInput) -> str:
     """Associate an account with a token"""
     
-    if not client_manager.is_configured:
+    if not client_manager().is_configured:
         return "❌ Error: Hedera client not configured. Please set OPERATOR_ID and OPERATOR_KEY."
     
-    if not SDK_AVAILABLE:
-        return f"🧪 Mock: Associated account {input.account_id} with token {input.token_id}"
-    
     try:
-        client = client_manager.client
-        account_id = AccountId.from_string(input.account_id)
-        token_id = TokenId.from_string(input.token_id)
-        
         # Create association transaction
-        transaction = TokenAssociateTransaction()\
-            .set_account_id(account_id)\
-            .add_token_id(token_id)
-        
-        # Set operator and node account IDs for proper signing
-        operator_id = AccountId.from_string(client_manager.operator_id)
-        transaction.operator_account_id = operator_id
-        node_ids = client.get_node_account_ids()
-        if node_ids:
-            transaction.node_account_id = node_ids[0]
+        transaction = _new_associate_tx(input.account_id, input.token_id)
         
-        # Execute transaction
-        receipt = transaction.execute(client)
+        # Execute transaction, retrying transient failures
+        receipt = await _execute_with_retry(transaction)
         
         
-        return f"✅ Associated account {input.account_id} with token {input.token_id}"
+        return _TMPL_ASSOCIATE.format(account_id=input.account_id, token_id=input.token_id)
         
     except Exception as e:
         return f"❌ Error associating token: {str(e)}"
 
+@_sdk_or_mock("dissociate_token")
 async def dissociate_token(input: DissociateTokenInput) -> str:
     """Dissociate an account from a token"""
     
-    if not client_manager.is_configured:
+    if not client_manager().is_configured:
         return "❌ Error: Hedera client not configured. Please set OPERATOR_ID and OPERATOR_KEY."
     
-    if not SDK_AVAILABLE:
-        return f"🧪 Mock: Dissociated account {input.account_id} from token {input.token_id}"
-    
     try:
-        client = client_manager.client
-        account_id = AccountId.from_string(input.account_id)
-        token_id = TokenId.from_string(input.token_id)
-        
         # Create dissociation transaction
-        transaction = TokenDissociateTransaction()\
-            .set_account_id(account_id)\
-            .add_token_id(token_id)
+        transaction = _new_dissociate_tx(input.account_id, input.token_id)
         
-        # Set operator and node account IDs for proper signing
-        transaction.operator_account_id = AccountId.from_string(client_manager.operator_id)
-        node_ids = client.get_node_account_ids()
-        if node_ids:
-            transaction.node_account_id = node_ids[0]
+        # Execute transaction, retrying transient failures
+        receipt = await _execute_with_retry(transaction)
         
-        # Execute transaction
-        receipt = transaction.execute(client)
         
-        
-        return f"✅ Dissociated account {input.account_id} from token {input.token_id}"
+        return _TMPL_DISSOCIATE.format(account_id=input.account_id, token_id=input.token_id)
         
     except Exception as e:
         return f"❌ Error dissociating token: {str(e)}"
 
+@_sdk_or_mock("delete_token")
 async def delete_token(input: DeleteTokenInput) -> str:
     """Delete a token"""
     
-    if not client_manager.is_configured:
+    if not client_manager().is_configured:
         return "❌ Error: Hedera client not configured. Please set OPERATOR_ID and OPERATOR_KEY."
     
-    if not SDK_AVAILABLE:
-        return f"🧪 Mock: Token {input.token_id} deleted"
-    
     try:
-        client = client_manager.client
-        token_id = TokenId.from_string(input.token_id)
-        
         # Create delete transaction
-        transaction = TokenDeleteTransaction()\
-            .set_token_id(token_id)
-        
-        # Set operator and node account IDs for proper signing
-        transaction.operator_account_id = AccountId.from_string(client_manager.operator_id)
-        node_ids = client.get_node_account_ids()
-        if node_ids:
-            transaction.node_account_id = node_ids[0]
+        transaction = _new_delete_tx(input.token_id)
         
-        # Execute transaction
-        receipt = transaction.execute(client)
+        # Execute transaction, retrying transient failures
+        receipt = await _execute_with_retry(transaction)
         
+        # Cached info would still show the token as live
+        get_token_info.cache.invalidate((input.token_id, client_manager().network))
         
-        return f"✅ Token {input.token_id} deleted"
+        return _TMPL_DELETE.format(token_id=input.token_id)
         
     except Exception as e:
         return f"❌ Error deleting token: {str(e)}"
 
-# Placeholder implementations for operations not yet implemented
-async def update_token(input: UpdateTokenInput) -> str:
-    if not SDK_AVAILABLE:
-        return f"🧪 Mock: Token {input.token_id} updated"
-    return f"❌ Token update not yet implemented in SDK wrapper"
-
-async def mint_token(input: MintTokenInput) -> str:
-    if not SDK_AVAILABLE:
-        return f"🧪 Mock: Minted {input.amount} units to token {input.token_id}"
-    return f"❌ Token minting not yet implemented in SDK wrapper"
-
-async def mint_nft(input: MintNftInput) -> str:
-    if not SDK_AVAILABLE:
-        return f"🧪 Mock: Minted {len(input.metadata)} NFT(s) for token {input.token_id}"
-    return f"❌ NFT minting not yet implemented in SDK wrapper"
-
-async def burn_token(input: BurnTokenInput) -> str:
-    if not SDK_AVAILABLE:
-        return f"🧪 Mock: Burned {input.amount} units from token {input.token_id}"
-    return f"❌ Token burning not yet implemented in SDK wrapper"
-
-async def burn_nft(input: BurnNftInput) -> str:
-    if not SDK_AVAILABLE:
-        return f"🧪 Mock: Burned {len(input.serial_numbers)} NFT(s) of token {input.token_id}"
-    return f"❌ NFT burning not yet implemented in SDK wrapper"
-
-async def transfer_token(input: TransferTokenInput) -> str:
-    if not SDK_AVAILABLE:
-        return f"🧪 Mock: Transferred {input.amount} of token {input.token_id} to {input.to_account_id}"
-    return f"❌ Token transfer not yet implemented in SDK wrapper"
-
-async def transfer_nft(input: TransferNftInput) -> str:
-    if not SDK_AVAILABLE:
-        return f"🧪 Mock: Transferred NFT {input.token_id}#{input.serial_number} to {input.to_account_id}"
-    return f"❌ NFT transfer not yet implemented in SDK wrapper"
-
-async def freeze_token_account(input: FreezeTokenAccountInput) -> str:
-    if not SDK_AVAILABLE:
-        return f"🧪 Mock: Frozen account {input.account_id} on token {input.token_id}"
-    return f"❌ Token freeze not yet implemented in SDK wrapper"
-
-async def unfreeze_token_account(input: UnfreezeTokenAccountInput) -> str:
-    if not SDK_AVAILABLE:
-        return f"🧪 Mock: Unfrozen account {input.account_id} on token {input.token_id}"
-    return f"❌ Token unfreeze not yet implemented in SDK wrapper"
-
-async def grant_kyc(input: GrantKycInput) -> str:
-    if not SDK_AVAILABLE:
-        return f"🧪 Mock: Granted KYC for account {input.account_id} on token {input.token_id}"
-    return f"❌ KYC grant not yet implemented in SDK wrapper"
-
-async def revoke_kyc(input: RevokeKycInput) -> str:
-    if not SDK_AVAILABLE:
-        return f"🧪 Mock: Revoked KYC for account {input.account_id} on token {input.token_id}"
-    return f"❌ KYC revoke not yet implemented in SDK wrapper"
-
-async def pause_token(input: PauseTokenInput) -> str:
-    if not SDK_AVAILABLE:
-        return f"🧪 Mock: Paused token {input.token_id}"
-    return f"❌ Token pause not yet implemented in SDK wrapper"
-
-async def unpause_token(input: UnpauseTokenInput) -> str:
-    if not SDK_AVAILABLE:
-        return f"🧪 Mock: Unpaused token {input.token_id}"
-    return f"❌ Token unpause not yet implemented in SDK wrapper"
-
-async def wipe_token_account(input: WipeTokenAccountInput) -> str:
-    if not SDK_AVAILABLE:
-        return f"🧪 Mock: Wiped {input.amount} tokens of {input.token_id} from account {input.account_id}"
-    return f"❌ Token wipe not yet implemented in SDK wrapper"
-
-async def wipe_token_account_nft(input: WipeTokenAccountNftInput) -> str:
-    if not SDK_AVAILABLE:
-        return f"🧪 Mock: Wiped NFT serials {input.serial_numbers} of token {input.token_id} from account {input.account_id}"
-    return f"❌ NFT wipe not yet implemented in SDK wrapper"
-
+def _build_airdrop_batch(client: Any, token_id: Any, account_ids: Iterable[str],
+                         amounts: Iterable[int]) -> "BatchTransaction":
+    """Wrap one token transfer per recipient in a single atomic batch"""
+    from hiero_sdk_python import BatchTransaction, TransferTransaction
+    
+    operator_id = client_manager().operator_account_id
+    batch_key = client.operator_private_key.public_key()
+    
+    inner = []
+    for account_id, amount in zip(account_ids, amounts):
+        transfer = TransferTransaction()
+        transfer.add_token_transfer(token_id, operator_id, -amount)
+        transfer.add_token_transfer(token_id, parse_account_id(account_id), amount)
+        # Sets the batch key, freezes and signs with the operator key
+        inner.append(transfer.batchify(client, batch_key))
+    batch: "BatchTransaction" = _for_operator(BatchTransaction(inner_transactions=inner))
+    return batch
+
+def _receipt_status(receipt: Any) -> str:
+    """ResponseCode name of a receipt's status"""
+    from hiero_sdk_python import ResponseCode
+    name: str = ResponseCode(receipt.status).name
+    return name
+
+@_sdk_or_mock("token_airdrop", require_config=False)
 async def token_airdrop(input: TokenAirdropInput) -> str:
-    if not SDK_AVAILABLE:
-        results = [f"{acct} (+{amount})" for acct, amount in input.recipients]
-        return f"🧪 Mock: Airdropped token {input.token_id} to accounts: " + ", ".join(results)
-    return f"❌ Token airdrop not yet implemented in SDK wrapper"
-
+    """
+    Airdrop a token to many recipients using HIP-551 atomic batches.
+    
+    Each batch of up to MAX_BATCH_SIZE recipients lands all-or-nothing, but larger
+    airdrops span several independent batches. When some fail, the result lists every
+    batch with its recipient range so only the failed ones need resending.
+    """
+    
+    if not client_manager().is_configured:
+        return "❌ Error: Hedera client not configured. Please set OPERATOR_ID and OPERATOR_KEY."
+    
+    if not input.account_ids:
+        return "❌ Error airdropping token: no recipients given"
+    
+    try:
+        client = client_manager().client
+        token_id = parse_token_id(input.token_id)
+        
+        async def submit(start: int) -> str:
+            end = start + MAX_BATCH_SIZE
+            batch = await asyncio.to_thread(
+                _build_airdrop_batch, client, token_id, input.account_ids[start:end], input.amounts[start:end]
+            )
+            return _receipt_status(await _execute_with_retry(batch))
+        
+        # One signed outer transaction per chunk; chunks are submitted concurrently
+        chunks = range(0, len(input.account_ids), MAX_BATCH_SIZE)
+        statuses = await asyncio.gather(*(submit(start) for start in chunks), return_exceptions=True)
+        
+        failed = sum(status != "SUCCESS" for status in statuses)
+        if failed:
+            lines = [
+                f"{'✅' if status == 'SUCCESS' else '❌'} Batch {number}, recipients {start + 1}-"
+                f"{min(start + MAX_BATCH_SIZE, len(input.account_ids))}: {status}"
+                for number, (start, status) in enumerate(zip(chunks, statuses), 1)
+            ]
+            return (
+                f"❌ Error airdropping token {input.token_id}: {failed} of {len(chunks)} batch(es) failed\n"
+                + "\n".join(lines)
+            )
+        
+        return _TMPL_AIRDROP.format(
+            total=sum(input.amounts), token_id=input.token_id, count=len(input.account_ids), batches=len(chunks)
+        )
+        
+    except Exception as e:
+        return f"❌ Error airdropping token: {str(e)}"
+
+def _format_supply(total_supply: int, decimals: int) -> str:
+    """Render a supply given in the lowest denomination with exactly `decimals` places"""
+    if not decimals:
+        return str(total_supply)
+    # Integer arithmetic: supplies above 2**53 do not survive a float division
+    whole, fraction = divmod(total_supply, 10 ** decimals)
+    return f"{whole}.{fraction:0{decimals}d}"
+
+def _token_cache_key(input: Any) -> Optional[Hashable]:
+    """Cache key for token lookups; None disables caching when unconfigured"""
+    if not client_manager().is_configured:
+        return None
+    return (input.token_id, client_manager().network)
+
+@_sdk_or_mock("get_token_info", require_config=False)
+@ttl_cached(ttl=5.0, maxsize=1024, key=_token_cache_key)
 async def get_token_info(input: GetTokenInfoInput) -> str:
-    if not SDK_AVAILABLE:
-        return f"🧪 Mock: Token {input.token_id}: MOCK (MockToken), total supply 10000"
-    return f"❌ Token info query not yet implemented in SDK wrapper" 
\ No newline at end of file
+    """Get a token's name, symbol and total supply"""
+    
+    if not client_manager().is_configured:
+        return ErrorResult("❌ Error: Hedera client not configured. Please set OPERATOR_ID and OPERATOR_KEY.")
+    
+    try:
+        from hiero_sdk_python import TokenInfoQuery
+        
+        client = client_manager().client
+        
+        # Execute query off the event loop
+        query = TokenInfoQuery(token_id=parse_token_id(input.token_id))
+        info = await asyncio.to_thread(query.execute, client)
+        
+        supply = _format_supply(info.total_supply, info.decimals or 0)
+        
+        return f"✅ Token {input.token_id}: {info.symbol} ({info.name}), total supply {supply}"
+        
+    except Exception as e:
+        return ErrorResult(f"❌ Error getting token info: {str(e)}")
+
+# Operations without a live implementation yet: tool name -> description for the error
+_PLACEHOLDERS = {
+    "update_token": "Token update",
+    "mint_token": "Token minting",
+    "mint_nft": "NFT minting",
+    "burn_token": "Token burning",
+    "burn_nft": "NFT burning",
+    "transfer_token": "Token transfer",
+    "transfer_nft": "NFT transfer",
+    "freeze_token_account": "Token freeze",
+    "unfreeze_token_account": "Token unfreeze",
+    "grant_kyc": "KYC grant",
+    "revoke_kyc": "KYC revoke",
+    "pause_token": "Token pause",
+    "unpause_token": "Token unpause",
+    "wipe_token_account": "Token wipe",
+    "wipe_token_account_nft": "NFT wipe",
+}
+
+if TYPE_CHECKING:
+    async def update_token(input: UpdateTokenInput) -> str: ...
+    async def mint_token(input: MintTokenInput) -> str: ...
+    async def mint_nft(input: MintNftInput) -> str: ...
+    async def burn_token(input: BurnTokenInput) -> str: ...
+    async def burn_nft(input: BurnNftInput) -> str: ...
+    async def transfer_token(input: TransferTokenInput) -> str: ...
+    async def transfer_nft(input: TransferNftInput) -> str: ...
+    async def freeze_token_account(input: FreezeTokenAccountInput) -> str: ...
+    async def unfreeze_token_account(input: UnfreezeTokenAccountInput) -> str: ...
+    async def grant_kyc(input: GrantKycInput) -> str: ...
+    async def revoke_kyc(input: RevokeKycInput) -> str: ...
+    async def pause_token(input: PauseTokenInput) -> str: ...
+    async def unpause_token(input: UnpauseTokenInput) -> str: ...
+    async def wipe_token_account(input: WipeTokenAccountInput) -> str: ...
+    async def wipe_token_account_nft(input: WipeTokenAccountNftInput) -> str: ...
+
+def __getattr__(name: str) -> Callable[[Any], Awaitable[str]]:
+    """Build placeholder tools on first access; mock mode serves their _MOCK_TEMPLATES entry"""
+    if name not in _PLACEHOLDERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    message = f"❌ {_PLACEHOLDERS[name]} not yet implemented in SDK wrapper"
+    
+    async def placeholder(input: Any) -> str:
+        return message
+    placeholder.__name__ = placeholder.__qualname__ = name
+    
+    func = _sdk_or_mock(name, require_config=False)(placeholder)
+    globals()[name] = func
+    return func
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_PLACEHOLDERS))
@@ -0,0 +1,86 @@
+"""
+Console Banners
+
+Shared welcome and help text for the CLI agent and demo scripts.
+"""
+
+from typing import Any, List
+
+WELCOME_BANNER = """🌟 Welcome to the Hedera CLI Agent! 🌟
+============================================================
+I can help you interact with the Hedera network using natural language!"""
+
+CAPABILITIES = """
+📋 What I can do:
+   • 🏦 Account Management: Create accounts, check balances, transfer HBAR
+   • 🪙 Token Operations: Create tokens, manage associations
+   • 💬 Consensus Service: Create topics, send messages
+   • 🔍 Query Operations: Get account info, token details, topic info
+
+💡 Example commands:
+   • 'Create a new account with 10 HBAR'
+   • 'Transfer 5 HBAR to account 0.0.12345'
+   • 'Check my balance'
+   • 'Create a token called MyToken with symbol MT'
+   • 'Create a topic for announcements'"""
+
+CREDENTIALS_HINT = """
+⚠️  To use real Hedera operations:
+   1. Set HEDERA_NETWORK=testnet (or mainnet)
+   2. Set OPERATOR_ID=0.0.your_account_id
+   3. Set OPERATOR_KEY=your_private_key
+   4. Restart the agent"""
+
+WELCOME_FOOTER = """============================================================
+Type 'quit', 'exit', or 'bye' to leave
+Type 'help' for more information
+"""
+
+HELP_BANNER = """
+📚 Hedera CLI Agent Help
+========================================
+🏦 Account Operations:
+   • Create account: 'Create a new account with X HBAR'
+   • Check balance: 'What's my balance?' or 'Check balance of 0.0.12345'
+   • Transfer HBAR: 'Send X HBAR to 0.0.12345'
+
+🪙 Token Operations:
+   • Create token: 'Create a token called TokenName with symbol TKN'
+   • Create NFT: 'Create an NFT collection called MyNFTs'
+   • Associate token: 'Associate my account with token 0.0.12345'
+   • Delete token: 'Delete token 0.0.12345'
+
+💬 Consensus Operations:
+   • Create topic: 'Create a topic for announcements'
+   • Send message: 'Send message "Hello World" to topic 0.0.12345'
+   • Topic info: 'Get info about topic 0.0.12345'
+========================================
+"""
+
+def config_status_lines(client_manager: Any) -> List[str]:
+    """Describe the client configuration, one bullet per line"""
+    return [
+        f"   • Network: {client_manager.network}",
+        f"   • Operator: {client_manager.operator_id or 'Not configured'}",
+        f"   • Client: {'✅ Connected' if client_manager.is_configured else '❌ Not configured'}",
+        f"   • Mode: {'🌐 Live Network' if client_manager.is_configured else '🧪 Mock/Testing'}",
+    ]
+
+def print_welcome(client_manager: Any, openai_configured: bool, model: str) -> None:
+    """Print the CLI agent welcome screen with the current configuration"""
+    lines = [
+        WELCOME_BANNER,
+        "\n⚙️  Configuration Status:",
+        *config_status_lines(client_manager),
+        f"   • OpenAI: {'✅ Configured' if openai_configured else '❌ Missing API key'}",
+        f"   • Model: {model} (override with OPENAI_MODEL)",
+        CAPABILITIES,
+    ]
+    if not client_manager.is_configured:
+        lines.append(CREDENTIALS_HINT)
+    lines.append(WELCOME_FOOTER)
+    print("\n".join(lines))
+
+def print_help() -> None:
+    """Print detailed help information"""
+    print(HELP_BANNER)
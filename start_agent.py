@@ -5,6 +5,7 @@ Hedera Agent Launcher - One Line Start
 Simple launcher script to start the Hedera CLI Agent with proper setup.
 """
 
+import asyncio
 import os
 import sys
 import subprocess
@@ -48,12 +49,20 @@ OPERATOR_KEY=your_private_key_here
         print("🚀 Starting Hedera CLI Agent...")
         print("=" * 40)
         
-        # Run the CLI agent from the demo directory
-        result = subprocess.run([
-            sys.executable, "cli_agent.py"
-        ], cwd=demo_dir)
+        # Run the CLI agent in this interpreter rather than starting a new one
+        sys.path.insert(0, str(demo_dir))
+        try:
+            import cli_agent
+        except ImportError:
+            # Fall back to a separate process from the demo directory
+            result = subprocess.run([
+                sys.executable, "cli_agent.py"
+            ], cwd=demo_dir)
+            return result.returncode
         
-        return result.returncode
+        cli_agent.use_uvloop()
+        asyncio.run(cli_agent.main())
+        return 0
         
     except Exception as e:
         print(f"❌ Error starting agent: {e}")
@@ -0,0 +1,65 @@
+import json
+import types
+import pytest
+
+@pytest.fixture
+def unconfigured(monkeypatch):
+    """The shared client manager with no Hedera client, as when credentials are missing"""
+    from hedera_agent_kit.client import client_manager
+    manager = client_manager()
+    monkeypatch.setattr(manager, "_client", None)
+    return manager
+
+@pytest.fixture
+def configured(monkeypatch):
+    """The shared client manager with a stand-in client and operator 0.0.2 on nodes 0.0.3-0.0.5"""
+    from hedera_agent_kit.client import client_manager
+    manager = client_manager()
+    operator_key = types.SimpleNamespace(public_key=lambda: "OPERATOR_PUB_KEY")
+    monkeypatch.setattr(manager, "_client", types.SimpleNamespace(operator_private_key=operator_key))
+    monkeypatch.setattr(manager, "_operator_id", "0.0.2")
+    monkeypatch.setattr(manager, "_operator_account_id", "0.0.2")
+    monkeypatch.setattr(manager, "_node_account_ids", ["0.0.3", "0.0.4", "0.0.5"])
+    monkeypatch.setattr(manager, "_default_node_account_id", "0.0.3")
+    return manager
+
+class _FakeResponse:
+    def __init__(self, status, body):
+        self.status = status
+        self._body = body
+    async def __aenter__(self):
+        return self
+    async def __aexit__(self, *exc_info):
+        return False
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise RuntimeError(f"HTTP {self.status}")
+    async def read(self):
+        return json.dumps(self._body).encode()
+
+class FakeMirror:
+    """Stand-in aiohttp session answering mirror node GETs with canned JSON by URL path"""
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self.requests = []
+        self._responses = {}
+    def respond(self, path, *bodies, status=200):
+        """
+        Queue responses for a path; the last one keeps being served.
+        A None body, like any unknown path, answers 404.
+        """
+        self._responses[path] = [(404, {}) if body is None else (status, body) for body in bodies] or [(status, {})]
+    def get(self, url, params=None):
+        path = url.removeprefix(self.base_url)
+        self.requests.append((path, params))
+        queue = self._responses.get(path, [(404, {})])
+        return _FakeResponse(*(queue.pop(0) if len(queue) > 1 else queue[0]))
+
+@pytest.fixture
+def mirror(configured, monkeypatch):
+    """Route the configured client manager's mirror node session to a FakeMirror"""
+    session = FakeMirror(configured.mirror_base_url)
+    async def fake_session():
+        return session
+    monkeypatch.setattr(configured, "session", fake_session)
+    return session
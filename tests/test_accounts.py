@@ -7,7 +7,7 @@ from hedera_agent_kit import accounts
 if not hasattr(accounts, "hedera_account"):
     accounts.hedera_account = types.SimpleNamespace()
 
-def test_create_account_generates_key(monkeypatch):
+async def test_create_account_generates_key(monkeypatch):
     dummy_priv = "PRIVATE_KEY_ABC"
     dummy_pub = "PUBLIC_KEY_ABC"
     async def fake_generate_key():
@@ -19,11 +19,11 @@ def test_create_account_generates_key(monkeypatch):
     monkeypatch.setattr(accounts.hedera_account, "generate_key", fake_generate_key)
     monkeypatch.setattr(accounts.hedera_account, "create_account", fake_create_account)
     inp = accounts.CreateAccountInput(initial_balance=1)
-    result = asyncio.get_event_loop().run_until_complete(accounts.create_account(inp))
+    result = await accounts.create_account(inp)
     assert "ID: 0.0.1001" in result
     assert dummy_priv in result and dummy_pub in result
 
-def test_create_account_with_existing_key(monkeypatch):
+async def test_create_account_with_existing_key(monkeypatch):
     async def fake_create_account(initial_balance, public_key):
         assert initial_balance == 500_000_000 and public_key == "EXISTING_PUB_KEY"
         return "0.0.2002"
@@ -32,27 +32,29 @@ def test_create_account_with_existing_key(monkeypatch):
     monkeypatch.setattr(accounts.hedera_account, "create_account", fake_create_account)
     monkeypatch.setattr(accounts.hedera_account, "generate_key", fake_generate_key)
     inp = accounts.CreateAccountInput(initial_balance=5, public_key="EXISTING_PUB_KEY")
-    result = asyncio.get_event_loop().run_until_complete(accounts.create_account(inp))
+    result = await accounts.create_account(inp)
     assert result == "Account created. ID: 0.0.2002"
 
-def test_update_and_delete_account(monkeypatch):
-    flags = {"update": False, "delete": False}
+async def test_update_and_delete_account(monkeypatch):
+    update_called = delete_called = False
     async def fake_update_account(account_id, new_public_key):
-        flags["update"] = True
+        nonlocal update_called
+        update_called = True
         assert account_id == "0.0.1234" and new_public_key == "NEW_PUB_KEY"
     async def fake_delete_account(account_id, transfer_account_id):
-        flags["delete"] = True
+        nonlocal delete_called
+        delete_called = True
         assert account_id == "0.0.1234" and transfer_account_id == "0.0.4321"
     monkeypatch.setattr(accounts.hedera_account, "update_account", fake_update_account)
     monkeypatch.setattr(accounts.hedera_account, "delete_account", fake_delete_account)
     inp_upd = accounts.UpdateAccountInput(account_id="0.0.1234", new_public_key="NEW_PUB_KEY")
-    res_upd = asyncio.get_event_loop().run_until_complete(accounts.update_account(inp_upd))
-    assert flags["update"] and "updated" in res_upd
+    res_upd = accounts.update_account(inp_upd)
+    assert update_called and "updated" in res_upd
     inp_del = accounts.DeleteAccountInput(account_id="0.0.1234", transfer_account_id="0.0.4321")
-    res_del = asyncio.get_event_loop().run_until_complete(accounts.delete_account(inp_del))
-    assert flags["delete"] and "deleted" in res_del
+    res_del = accounts.delete_account(inp_del)
+    assert delete_called and "deleted" in res_del
 
-def test_transfer_hbar(monkeypatch):
+async def test_transfer_hbar(monkeypatch):
     captured = {}
     async def fake_transfer_hbar(to_account_id, amount, memo=""):
         captured["to"] = to_account_id
@@ -60,13 +62,13 @@ def test_transfer_hbar(monkeypatch):
         captured["memo"] = memo
     monkeypatch.setattr(accounts.hedera_account, "transfer_hbar", fake_transfer_hbar)
     inp = accounts.TransferHbarInput(to_account_id="0.0.5555", amount=2.5, memo="Test Payment")
-    result = asyncio.get_event_loop().run_until_complete(accounts.transfer_hbar(inp))
+    result = await accounts.transfer_hbar(inp)
     assert captured["to"] == "0.0.5555"
     assert captured["amount"] == 250_000_000  # 2.5 HBAR in tinybars
     assert captured["memo"] == "Test Payment"
     assert "Transferred 2.5 HBAR" in result
 
-def test_get_balance(monkeypatch):
+async def test_get_balance(monkeypatch):
     async def fake_get_balance_no_arg():
         return 750_000_000  # 7.5 HBAR in tinybars
     async def fake_get_balance_with_arg(account_id=None):
@@ -75,46 +77,191 @@ def test_get_balance(monkeypatch):
     # No account_id provided
     monkeypatch.setattr(accounts.hedera_account, "get_balance", fake_get_balance_no_arg)
     inp = accounts.GetBalanceInput()
-    res = asyncio.get_event_loop().run_until_complete(accounts.get_balance(inp))
+    res = await accounts.get_balance(inp)
     assert "7.5" in res and "HBAR" in res
     # With specific account_id
     monkeypatch.setattr(accounts.hedera_account, "get_balance", fake_get_balance_with_arg)
     inp2 = accounts.GetBalanceInput(account_id="0.0.9999")
-    res2 = asyncio.get_event_loop().run_until_complete(accounts.get_balance(inp2))
+    res2 = await accounts.get_balance(inp2)
     assert "1" in res2 and "HBAR" in res2
 
-def test_get_account_info(monkeypatch):
+async def test_get_account_info(monkeypatch):
     async def fake_get_account_info(account_id):
         assert account_id == "0.0.1111"
         return {"balance": 12300000000, "public_key": "TESTPUBKEY"}  # 123 HBAR
     monkeypatch.setattr(accounts.hedera_account, "get_account_info", fake_get_account_info)
     inp = accounts.GetAccountInfoInput(account_id="0.0.1111")
-    res = asyncio.get_event_loop().run_until_complete(accounts.get_account_info(inp))
+    res = await accounts.get_account_info(inp)
     assert "balance 123" in res and "TESTPUBKEY" in res
 
-def test_approve_allowances(monkeypatch):
-    called = {"hbar": False, "token": False}
+async def test_approve_allowances(monkeypatch):
+    hbar_called = token_called = False
     async def fake_approve_hbar_allowance(spender_account_id, amount):
-        called["hbar"] = True
+        nonlocal hbar_called
+        hbar_called = True
         assert spender_account_id == "0.0.2222" and amount == 500_000_000  # 5 HBAR
     async def fake_approve_token_allowance(token_id, spender_account_id, amount):
-        called["token"] = True
+        nonlocal token_called
+        token_called = True
         assert token_id == "0.0.3333" and spender_account_id == "0.0.4444" and amount == 1000
     monkeypatch.setattr(accounts.hedera_account, "approve_hbar_allowance", fake_approve_hbar_allowance)
     monkeypatch.setattr(accounts.hedera_account, "approve_token_allowance", fake_approve_token_allowance)
     inp_hbar = accounts.ApproveHbarAllowanceInput(spender_account_id="0.0.2222", amount=5)
-    res_hbar = asyncio.get_event_loop().run_until_complete(accounts.approve_hbar_allowance(inp_hbar))
-    assert called["hbar"] and "Approved allowance" in res_hbar
+    res_hbar = accounts.approve_hbar_allowance(inp_hbar)
+    assert hbar_called and "Approved allowance" in res_hbar
     inp_token = accounts.ApproveTokenAllowanceInput(token_id="0.0.3333", spender_account_id="0.0.4444", amount=1000)
-    res_token = asyncio.get_event_loop().run_until_complete(accounts.approve_token_allowance(inp_token))
-    assert called["token"] and "Approved allowance" in res_token
+    res_token = accounts.approve_token_allowance(inp_token)
+    assert token_called and "Approved allowance" in res_token
 
-def test_sign_schedule(monkeypatch):
-    done = {"called": False}
+async def test_sign_schedule(monkeypatch):
+    called = False
     async def fake_sign_schedule(schedule_id):
-        done["called"] = True
+        nonlocal called
+        called = True
         assert schedule_id == "0.0.5555"
     monkeypatch.setattr(accounts.hedera_account, "sign_schedule", fake_sign_schedule)
     inp = accounts.SignScheduleInput(schedule_id="0.0.5555")
-    res = asyncio.get_event_loop().run_until_complete(accounts.sign_schedule(inp))
-    assert done["called"] and "Signed scheduled transaction" in res 
\ No newline at end of file
+    res = accounts.sign_schedule(inp)
+    assert called and "Signed scheduled transaction" in res
+
+
+@pytest.fixture
+def live(mirror, monkeypatch):
+    """Take the SDK code paths against the fake mirror node, with empty caches and no watcher"""
+    monkeypatch.setattr(accounts, "SDK_AVAILABLE", True)
+    monkeypatch.setattr(accounts, "_WATCH_AFTER_READS", float("inf"))
+    accounts.get_balance.cache.clear()
+    yield mirror
+    accounts.get_balance.cache.clear()
+
+async def test_get_balances_batched(live):
+    live.respond("/api/v1/balances", {"balances": [
+        {"account": "0.0.1001", "balance": 150_000_000},
+        {"account": "0.0.1002", "balance": 1},
+    ]})
+    res = await accounts.get_balances(accounts.GetBalancesInput(account_ids=["0.0.1002", "0.0.1001"]))
+    assert res.splitlines() == [
+        "✅ Account 0.0.1002 balance: 0.00000001 HBAR",
+        "✅ Account 0.0.1001 balance: 1.5 HBAR",
+    ]
+    assert live.requests == [("/api/v1/balances", [("account.id", "0.0.1002"), ("account.id", "0.0.1001"), ("limit", "2")])]
+    # The batch filled get_balance's cache
+    assert await accounts.get_balance(accounts.GetBalanceInput(account_id="0.0.1001")) == "✅ Account 0.0.1001 balance: 1.5 HBAR"
+    assert len(live.requests) == 1
+
+async def test_get_balances_falls_back_per_account(live):
+    live.respond("/api/v1/balances", status=500)
+    live.respond("/api/v1/accounts/0.0.1001", {"balance": {"balance": 250_000_000}})
+    accounts.get_balance.cache.set(("0.0.1003", accounts.client_manager().network), "✅ Account 0.0.1003 balance: 3 HBAR")
+    res = await accounts.get_balances(accounts.GetBalancesInput(account_ids=["0.0.1001", "bad", "0.0.1003"]))
+    assert res.splitlines() == [
+        "✅ Account 0.0.1001 balance: 2.5 HBAR",
+        "❌ Error: invalid account ID 'bad' (expected format 0.0.12345)",
+        "✅ Account 0.0.1003 balance: 3 HBAR",
+    ]
+    # The cached account is never requested; the malformed one never reaches the mirror node
+    assert [path for path, _ in live.requests] == ["/api/v1/balances", "/api/v1/accounts/0.0.1001"]
+
+async def test_get_balances_limits_fallback_concurrency(live, monkeypatch):
+    live.respond("/api/v1/balances", {"balances": []})
+    running = peak = 0
+    async def fake_get_balance(input):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return f"✅ Account {input.account_id} balance: 1 HBAR"
+    fake_get_balance.cache = accounts.get_balance.cache
+    monkeypatch.setattr(accounts, "get_balance", fake_get_balance)
+    monkeypatch.setattr(accounts, "_MAX_CONCURRENT_LOOKUPS", 2)
+    account_ids = [f"0.0.{2000 + n}" for n in range(6)]
+    res = await accounts.get_balances(accounts.GetBalancesInput(account_ids=account_ids))
+    assert res.splitlines() == [f"✅ Account {a} balance: 1 HBAR" for a in account_ids]
+    assert peak == 2
+
+_TX_ID = "0.0.2@1700000000.123456789"
+_TX_PATH = "/api/v1/transactions/0.0.2-1700000000-123456789"
+
+@pytest.mark.parametrize("transaction_id, expected", [
+    (_TX_ID, "0.0.2-1700000000-123456789"),
+    ("0.0.2-1700000000-123456789", "0.0.2-1700000000-123456789"),
+])
+async def test_mirror_transaction_id(transaction_id, expected):
+    assert accounts._mirror_transaction_id(transaction_id) == expected
+
+async def test_get_receipt_found(live, monkeypatch):
+    monkeypatch.setattr(accounts, "_RECEIPT_DELAY", 0)
+    # Not on the mirror node yet on the first poll
+    live.respond(_TX_PATH, None, {"transactions": [{"result": "SUCCESS"}]})
+    res = await accounts.get_receipt(accounts.GetReceiptInput(transaction_id=_TX_ID))
+    assert res == f"✅ Transaction {_TX_ID} status: SUCCESS"
+    assert [path for path, _ in live.requests] == [_TX_PATH, _TX_PATH]
+
+async def test_get_receipt_failed_transaction(live):
+    live.respond(_TX_PATH, {"transactions": [{"result": "INSUFFICIENT_PAYER_BALANCE"}]})
+    res = await accounts.get_receipt(accounts.GetReceiptInput(transaction_id=_TX_ID))
+    assert res == f"❌ Transaction {_TX_ID} failed: INSUFFICIENT_PAYER_BALANCE"
+
+async def test_get_receipt_not_found(live, monkeypatch):
+    monkeypatch.setattr(accounts, "_RECEIPT_DELAY", 0)
+    res = await accounts.get_receipt(accounts.GetReceiptInput(transaction_id=_TX_ID))
+    assert res == f"❌ Error getting receipt: transaction {_TX_ID} not found on the mirror node yet"
+    assert len(live.requests) == accounts._RECEIPT_ATTEMPTS
+
+@pytest.mark.parametrize("transaction_id", ["0.0.2", "0.0.2@later", "../accounts/0.0.2"])
+async def test_get_receipt_malformed_id(live, transaction_id):
+    res = await accounts.get_receipt(accounts.GetReceiptInput(transaction_id=transaction_id))
+    assert res.startswith(f"❌ Error: invalid transaction ID '{transaction_id}'")
+    assert live.requests == []
+
+@pytest.fixture
+def submitted_transfers(live, monkeypatch):
+    """Fake the SDK submission; records (to_account_id, tinybars, memo) per transfer"""
+    transfers = []
+    async def fake_submit_transfer(input, tinybars):
+        transfers.append((input.to_account_id, tinybars, input.memo))
+        return types.SimpleNamespace(transaction_id=_TX_ID, get_receipt=lambda client: None)
+    monkeypatch.setattr(accounts, "_submit_transfer", fake_submit_transfer)
+    return transfers
+
+async def test_submit_transfer_hbar_returns_transaction_id(submitted_transfers):
+    res = await accounts.submit_transfer_hbar(accounts.TransferHbarInput(to_account_id="0.0.5555", amount=2.5, memo="rent"))
+    assert res == f"✅ Submitted transfer of 2.5 HBAR to 0.0.5555. Transaction: {_TX_ID}"
+    assert submitted_transfers == [("0.0.5555", 250_000_000, "rent")]
+
+async def test_transfer_hbar_waits_for_receipt(submitted_transfers):
+    res = await accounts.transfer_hbar(accounts.TransferHbarInput(to_account_id="0.0.5555", amount_tinybars=1))
+    assert res == f"✅ Transferred 0.00000001 HBAR to 0.0.5555. Transaction: {_TX_ID}"
+
+@pytest.mark.parametrize("inp, expected", [
+    (accounts.TransferHbarInput(to_account_id="5555", amount=1), "❌ Error: invalid account ID '5555' (expected format 0.0.12345)"),
+    (accounts.TransferHbarInput(to_account_id="0.0.5555", amount_tinybars=0), "❌ Error: transfer amount must be greater than zero"),
+])
+async def test_submit_transfer_hbar_rejects_bad_input(submitted_transfers, inp, expected):
+    assert await accounts.submit_transfer_hbar(inp) == expected
+    assert submitted_transfers == []
+
+@pytest.mark.parametrize("hbar, tinybars, expected", [
+    (0.1, None, 10_000_000),
+    (2.5, None, 250_000_000),
+    (0.1 + 0.2, None, 30_000_000),
+    (None, None, 0),
+    # The exact tinybar amount wins over the HBAR amount
+    (5, 1, 1),
+])
+async def test_to_tinybars(hbar, tinybars, expected):
+    assert accounts.to_tinybars(hbar, tinybars) == expected
+
+@pytest.mark.parametrize("tinybars, expected", [(10_000_000, "0.1"), (-150_000_000, "-1.5"), (0, "0"), (1, "0.00000001")])
+async def test_format_tinybars(tinybars, expected):
+    assert accounts._format_tinybars(tinybars) == expected
+
+async def test_transfer_hbar_prefers_tinybars(unconfigured):
+    res = await accounts.transfer_hbar(accounts.TransferHbarInput(to_account_id="0.0.5555", amount=5, amount_tinybars=1))
+    assert res == "🧪 Mock: Transferred 0.00000001 HBAR to 0.0.5555"
+
+@pytest.mark.parametrize("fields", [{}, {"amount": -1}, {"amount_tinybars": -1}], ids=["neither", "negative", "negative-tinybars"])
+async def test_transfer_hbar_input_validation(fields):
+    with pytest.raises(ValueError):
+        accounts.TransferHbarInput(to_account_id="0.0.5555", **fields)
@@ -1,9 +1,9 @@
-import asyncio
 import pytest
 from hedera_agent_kit import agent_registry
 from hedera_agent_kit.accounts import CreateAccountInput
+from hedera_agent_kit.consensus import GetTopicMessagesInput, stream_topic_messages
 
-def test_get_schema_and_call_tool(monkeypatch):
+async def test_get_schema_and_call_tool(monkeypatch):
     schema_cls = agent_registry.get_schema("create_account")
     assert schema_cls is CreateAccountInput
     async def dummy_create_account(input_obj):
@@ -11,10 +11,10 @@ def test_get_schema_and_call_tool(monkeypatch):
         return "DUMMY_ACCOUNT_CREATED"
     orig_schema, orig_func = agent_registry._tools["create_account"]
     monkeypatch.setitem(agent_registry._tools, "create_account", (orig_schema, dummy_create_account))
-    result = asyncio.get_event_loop().run_until_complete(agent_registry.call_tool("create_account", {"initial_balance": 10, "public_key": "dummy"}))
+    result = await agent_registry.call_tool("create_account", {"initial_balance": 10, "public_key": "dummy"})
     assert result == "DUMMY_ACCOUNT_CREATED"
 
-def test_call_tool_various(monkeypatch):
+async def test_call_tool_various(monkeypatch):
     async def dummy_token_tool(input_obj):
         return f"CALLED_{getattr(input_obj, 'symbol', 'TOKEN')}"
     async def dummy_consensus_tool(input_obj):
@@ -24,12 +24,29 @@ def test_call_tool_various(monkeypatch):
     orig_schema_cons, orig_func_cons = agent_registry._tools["create_topic"]
     monkeypatch.setitem(agent_registry._tools, "create_topic", (orig_schema_cons, dummy_consensus_tool))
     token_args = {"name": "TokenX", "symbol": "TKX", "initial_supply": 0, "decimals": 0}
-    res_token = asyncio.get_event_loop().run_until_complete(agent_registry.call_tool("create_fungible_token", token_args))
+    res_token = await agent_registry.call_tool("create_fungible_token", token_args)
     assert res_token == "CALLED_TKX"
     topic_args = {"memo": "TestMemo"}
-    res_topic = asyncio.get_event_loop().run_until_complete(agent_registry.call_tool("create_topic", topic_args))
+    res_topic = await agent_registry.call_tool("create_topic", topic_args)
     assert res_topic.startswith("CALLED_TOPIC_")
 
-def test_call_tool_unknown():
+async def test_call_tool_unknown():
     with pytest.raises(KeyError):
-        asyncio.get_event_loop().run_until_complete(agent_registry.call_tool("nonexistent_tool", {})) 
\ No newline at end of file
+        await agent_registry.call_tool("nonexistent_tool", {})
+
+async def test_register_tool_rejects_async_generator():
+    assert "stream_topic_messages" not in agent_registry._tools
+    with pytest.raises(TypeError):
+        agent_registry.register_tool("stream_topic_messages", GetTopicMessagesInput, stream_topic_messages)
+    assert "stream_topic_messages" not in agent_registry._tools
+
+async def test_register_tool_adds_a_callable_tool(monkeypatch):
+    monkeypatch.setattr(agent_registry, "_tools", dict(agent_registry._tools))
+    monkeypatch.setattr(agent_registry, "_tool_names", agent_registry._tool_names)
+    async def echo(input_obj):
+        return f"ECHO_{input_obj.topic_id}"
+    # Built at runtime, so not the same object as the name registered
+    name = "".join(["my_", "operation"])
+    agent_registry.register_tool(name, GetTopicMessagesInput, echo)
+    assert "my_operation" in agent_registry._tool_names
+    assert await agent_registry.call_tool("my_operation", {"topic_id": "0.0.5"}) == "ECHO_0.0.5"
@@ -0,0 +1,97 @@
+from hedera_agent_kit._cache import ErrorResult, TTLCache, ttl_cached
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+    def __call__(self):
+        return self.now
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = TTLCache(ttl=5.0, clock=clock)
+    cache.set("a", 1)
+    clock.now += 4.9
+    assert cache.get("a") == 1
+    clock.now += 0.1
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(ttl=5.0, maxsize=2, clock=FakeClock())
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # Reading "a" makes "b" the least recently used
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+def test_negative_entries_use_negative_ttl():
+    clock = FakeClock()
+    cache = TTLCache(ttl=5.0, negative_ttl=1.0, clock=clock)
+    cache.set("ok", "fine")
+    cache.set("err", "failed", negative=True)
+    clock.now += 1.0
+    assert cache.get("err") is None
+    assert cache.get("ok") == "fine"
+
+def test_zero_negative_ttl_drops_the_entry():
+    cache = TTLCache(ttl=5.0, negative_ttl=0, clock=FakeClock())
+    cache.set("err", "stale")
+    cache.set("err", "failed", negative=True)
+    assert cache.get("err") is None
+
+def test_invalidate_and_clear():
+    cache = TTLCache(ttl=5.0, clock=FakeClock())
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.invalidate("a")
+    cache.invalidate("missing")
+    assert cache.get("a") is None and cache.get("b") == 2
+    cache.clear()
+    assert len(cache) == 0
+
+def _counting_tool(results, **options):
+    """A cached tool returning the given results in turn, and its call log"""
+    calls = []
+    @ttl_cached(ttl=5.0, **options)
+    async def tool(input):
+        calls.append(input)
+        return results[len(calls) - 1]
+    tool.cache.clock = FakeClock()
+    return tool, calls
+
+async def test_ttl_cached_serves_repeat_calls_from_cache():
+    tool, calls = _counting_tool(["first", "second"])
+    assert await tool("x") == "first"
+    assert await tool("x") == "first"
+    assert calls == ["x"]
+    tool.cache.clock.now += 5.0
+    assert await tool("x") == "second"
+
+async def test_ttl_cached_none_key_bypasses_cache():
+    tool, calls = _counting_tool(["first", "second"], key=lambda input: None)
+    assert await tool("x") == "first"
+    assert await tool("x") == "second"
+    assert len(tool.cache) == 0
+
+async def test_ttl_cached_keeps_error_results_briefly():
+    tool, calls = _counting_tool([ErrorResult("❌ Error: node busy"), "✅ recovered"], negative_ttl=1.0)
+    assert await tool("x") == "❌ Error: node busy"
+    assert await tool("x") == "❌ Error: node busy"
+    tool.cache.clock.now += 1.0
+    assert await tool("x") == "✅ recovered"
+    assert len(calls) == 2
+
+async def test_ttl_cached_does_not_guess_errors_from_text():
+    # Only ErrorResult marks an error; a result that merely looks like one is cached normally
+    tool, calls = _counting_tool(["❌ looks like an error", "other"], negative_ttl=0)
+    assert await tool("x") == "❌ looks like an error"
+    assert await tool("x") == "❌ looks like an error"
+    assert len(calls) == 1
+
+async def test_ttl_cached_invalidation():
+    tool, calls = _counting_tool(["first", "second"], key=lambda input: ("k", input))
+    await tool("x")
+    tool.cache.invalidate(("k", "x"))
+    assert await tool("x") == "second"
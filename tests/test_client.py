@@ -0,0 +1,27 @@
+from hedera_agent_kit import client
+
+def test_rotate_node_moves_off_failed_node(configured):
+    assert configured.rotate_node(failed="0.0.3") == "0.0.4"
+    assert configured.default_node_account_id == "0.0.4"
+
+def test_rotate_node_wraps_around(configured, monkeypatch):
+    monkeypatch.setattr(configured, "_default_node_account_id", "0.0.5")
+    assert configured.rotate_node(failed="0.0.5") == "0.0.3"
+
+def test_rotate_node_ignores_stale_failures(configured):
+    # Two transactions failed on 0.0.3 at once; only the first report rotates
+    assert configured.rotate_node(failed="0.0.3") == "0.0.4"
+    assert configured.rotate_node(failed="0.0.3") == "0.0.4"
+
+def test_rotate_node_without_known_nodes(configured, monkeypatch):
+    monkeypatch.setattr(configured, "_node_account_ids", [])
+    assert configured.rotate_node(failed="0.0.3") == "0.0.3"
+
+def test_failure_predicates():
+    class StatusError(Exception):
+        def __init__(self, name):
+            self.status = type("Status", (), {"name": name})()
+    assert client.is_node_failure(StatusError("INVALID_NODE_ACCOUNT"))
+    assert client.is_transient_failure(StatusError("BUSY"))
+    assert client.is_duplicate_transaction(StatusError("DUPLICATE_TRANSACTION"))
+    assert not client.is_transient_failure(StatusError("INVALID_SIGNATURE"))
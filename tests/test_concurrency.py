@@ -0,0 +1,19 @@
+import asyncio
+from hedera_agent_kit._concurrency import run_many
+
+async def test_run_many_limits_concurrency_and_keeps_order():
+    running = peak = 0
+    async def job(n):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        # Later jobs finish first, so completion order differs from input order
+        await asyncio.sleep((20 - n) / 1000)
+        running -= 1
+        if n == 7:
+            raise ValueError("job 7")
+        return n
+    results = await run_many((job(n) for n in range(20)), max_workers=3)
+    assert peak == 3
+    assert [r for r in results if not isinstance(r, Exception)] == [n for n in range(20) if n != 7]
+    assert isinstance(results[7], ValueError)
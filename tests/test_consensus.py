@@ -1,4 +1,4 @@
-import asyncio
+import base64
 import types
 import pytest
 from hedera_agent_kit import consensus
@@ -6,7 +6,7 @@ from hedera_agent_kit import consensus
 if not hasattr(consensus, "hedera_consensus"):
     consensus.hedera_consensus = types.SimpleNamespace()
 
-def test_create_topic(monkeypatch):
+async def test_create_topic(monkeypatch):
     async def fake_create_topic_no_arg():
         return "0.0.11111"
     async def fake_create_topic_with_memo(memo=None):
@@ -14,50 +14,53 @@ def test_create_topic(monkeypatch):
         return "0.0.22222"
     monkeypatch.setattr(consensus.hedera_consensus, "create_topic", fake_create_topic_no_arg)
     inp_no = consensus.CreateTopicInput()
-    res_no = asyncio.get_event_loop().run_until_complete(consensus.create_topic(inp_no))
+    res_no = await consensus.create_topic(inp_no)
     assert res_no == "Topic created: 0.0.11111"
     monkeypatch.setattr(consensus.hedera_consensus, "create_topic", fake_create_topic_with_memo)
     inp_mem = consensus.CreateTopicInput(memo="MyTopic")
-    res_mem = asyncio.get_event_loop().run_until_complete(consensus.create_topic(inp_mem))
+    res_mem = await consensus.create_topic(inp_mem)
     assert res_mem == "Topic created: 0.0.22222"
 
-def test_update_and_delete_topic(monkeypatch):
-    flags = {"update": False, "delete": False}
+async def test_update_and_delete_topic(monkeypatch):
+    update_called = delete_called = False
     async def fake_update_topic(topic_id, memo):
-        flags["update"] = True
+        nonlocal update_called
+        update_called = True
         assert topic_id == "0.0.33333" and memo == "NewMemo"
     async def fake_delete_topic(topic_id):
-        flags["delete"] = True
+        nonlocal delete_called
+        delete_called = True
         assert topic_id == "0.0.33333"
     monkeypatch.setattr(consensus.hedera_consensus, "update_topic", fake_update_topic)
     monkeypatch.setattr(consensus.hedera_consensus, "delete_topic", fake_delete_topic)
     inp_up = consensus.UpdateTopicInput(topic_id="0.0.33333", memo="NewMemo")
-    res_up = asyncio.get_event_loop().run_until_complete(consensus.update_topic(inp_up))
-    assert flags["update"] and "updated" in res_up
+    res_up = await consensus.update_topic(inp_up)
+    assert update_called and "updated" in res_up
     inp_del = consensus.DeleteTopicInput(topic_id="0.0.33333")
-    res_del = asyncio.get_event_loop().run_until_complete(consensus.delete_topic(inp_del))
-    assert flags["delete"] and "deleted" in res_del
+    res_del = await consensus.delete_topic(inp_del)
+    assert delete_called and "deleted" in res_del
 
-def test_submit_message(monkeypatch):
-    done = {"called": False}
+async def test_submit_message(monkeypatch):
+    called = False
     async def fake_submit_message(topic_id, message):
-        done["called"] = True
+        nonlocal called
+        called = True
         assert topic_id == "0.0.44444" and message == "Hello World"
     monkeypatch.setattr(consensus.hedera_consensus, "submit_message", fake_submit_message)
     inp = consensus.SubmitMessageInput(topic_id="0.0.44444", message="Hello World")
-    res = asyncio.get_event_loop().run_until_complete(consensus.submit_message(inp))
-    assert done["called"] and "submitted to topic 0.0.44444" in res
+    res = await consensus.submit_message(inp)
+    assert called and "submitted to topic 0.0.44444" in res
 
-def test_get_topic_info(monkeypatch):
+async def test_get_topic_info(monkeypatch):
     async def fake_get_topic_info(topic_id):
         assert topic_id == "0.0.55555"
         return {"memo": "TopicMemo", "sequence_number": 10}
     monkeypatch.setattr(consensus.hedera_consensus, "get_topic_info", fake_get_topic_info)
     inp = consensus.GetTopicInfoInput(topic_id="0.0.55555")
-    res = asyncio.get_event_loop().run_until_complete(consensus.get_topic_info(inp))
+    res = await consensus.get_topic_info(inp)
     assert "memo='TopicMemo'" in res and "message_count=10" in res
 
-def test_get_topic_messages(monkeypatch):
+async def test_get_topic_messages(monkeypatch):
     async def fake_get_topic_messages(topic_id, limit=None):
         assert topic_id == "0.0.66666"
         if limit == 2:
@@ -66,8 +69,40 @@ def test_get_topic_messages(monkeypatch):
             return []
     monkeypatch.setattr(consensus.hedera_consensus, "get_topic_messages", fake_get_topic_messages)
     inp_empty = consensus.GetTopicMessagesInput(topic_id="0.0.66666")
-    res_empty = asyncio.get_event_loop().run_until_complete(consensus.get_topic_messages(inp_empty))
+    res_empty = await consensus.get_topic_messages(inp_empty)
     assert "No messages" in res_empty
     inp_some = consensus.GetTopicMessagesInput(topic_id="0.0.66666", limit=2)
-    res_some = asyncio.get_event_loop().run_until_complete(consensus.get_topic_messages(inp_some))
-    assert "msg1" in res_some and "msg2" in res_some 
\ No newline at end of file
+    res_some = await consensus.get_topic_messages(inp_some)
+    assert "msg1" in res_some and "msg2" in res_some
+
+
+async def test_submit_message_rejects_oversized_payload(configured, monkeypatch):
+    monkeypatch.setattr(consensus, "SDK_AVAILABLE", True)
+    # 3 UTF-8 bytes per character puts this just over the limit
+    message = "€" * (consensus.MAX_MESSAGE_BYTES // 3 + 1)
+    res = await consensus.submit_message(consensus.SubmitMessageInput(topic_id="0.0.44444", message=message))
+    assert res == f"❌ Error submitting message: {len(message) * 3} bytes exceeds the {consensus.MAX_MESSAGE_BYTES} byte limit"
+
+async def _collect(inp):
+    return [message async for message in consensus.stream_topic_messages(inp)]
+
+async def test_stream_topic_messages_requires_configuration(unconfigured):
+    with pytest.raises(RuntimeError, match="not configured"):
+        await _collect(consensus.GetTopicMessagesInput(topic_id="0.0.66666"))
+
+async def test_stream_topic_messages_follows_pages(mirror, monkeypatch):
+    monkeypatch.setattr(consensus, "SDK_AVAILABLE", True)
+    encoded = [base64.b64encode(text.encode()).decode() for text in ("one", "two", "three")]
+    first = "/api/v1/topics/0.0.66666/messages?limit=3"
+    second = "/api/v1/topics/0.0.66666/messages?limit=3&timestamp=gt:1"
+    mirror.respond(first, {"messages": [{"message": m} for m in encoded[:2]], "links": {"next": second}})
+    mirror.respond(second, {"messages": [{"message": encoded[2]}, {"message": encoded[0]}], "links": {"next": None}})
+    messages = await _collect(consensus.GetTopicMessagesInput(topic_id="0.0.66666", limit=3))
+    # The limit stops the stream partway through the second page
+    assert messages == ["one", "two", "three"]
+    assert [path for path, _ in mirror.requests] == [first, second]
+
+@pytest.mark.parametrize("limit", [0, -5])
+async def test_topic_messages_limit_must_be_positive(limit):
+    with pytest.raises(ValueError, match="limit must be positive"):
+        consensus.GetTopicMessagesInput(topic_id="0.0.66666", limit=limit)
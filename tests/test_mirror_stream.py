@@ -0,0 +1,44 @@
+import asyncio
+from collections import Counter
+from hedera_agent_kit import accounts
+from hedera_agent_kit._mirror_stream import watch_accounts
+
+async def test_watch_accounts_reports_new_transactions(mirror):
+    mirror.respond("/api/v1/transactions",
+                   {"transactions": []},
+                   {"transactions": [{"consensus_timestamp": "1700000000.000000001"}]},
+                   {"transactions": []})
+    changed = asyncio.Event()
+    events = []
+    def on_event(account_id):
+        events.append(account_id)
+        changed.set()
+    watcher = asyncio.create_task(watch_accounts({"0.0.1234"}, on_event, interval=0))
+    await asyncio.wait_for(changed.wait(), timeout=1)
+    while len(mirror.requests) < 3:
+        await asyncio.sleep(0)
+    watcher.cancel()
+    assert events == ["0.0.1234"]
+    # The next poll starts after the last transaction seen
+    assert mirror.requests[2][1]["timestamp"] == "gt:1700000000.000000001"
+
+async def test_watch_accounts_survives_a_failed_poll(mirror):
+    mirror.respond("/api/v1/transactions", None, {"transactions": [{"consensus_timestamp": "1.0"}]})
+    changed = asyncio.Event()
+    watcher = asyncio.create_task(watch_accounts({"0.0.1234"}, lambda account_id: changed.set(), interval=0))
+    await asyncio.wait_for(changed.wait(), timeout=1)
+    watcher.cancel()
+
+async def test_aclose_stops_the_balance_watcher(configured, mirror, monkeypatch):
+    mirror.respond("/api/v1/transactions", {"transactions": []})
+    monkeypatch.setattr(accounts, "_WATCH_AFTER_READS", 1)
+    monkeypatch.setattr(accounts, "_balance_reads", Counter())
+    monkeypatch.setattr(accounts, "_watched_accounts", set())
+    monkeypatch.setattr(accounts, "_watcher", None)
+    accounts._track_balance_read("0.0.1234")
+    watcher = accounts._watcher
+    assert watcher is not None and "0.0.1234" in accounts._watched_accounts
+    while not mirror.requests:
+        await asyncio.sleep(0)
+    await configured.aclose()
+    assert watcher.cancelled()
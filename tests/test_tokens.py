@@ -1,218 +1,321 @@
 import asyncio
+import re
 import types
 import pytest
 from hedera_agent_kit import tokens
 
-if not hasattr(tokens, "hedera_token"):
-    tokens.hedera_token = types.SimpleNamespace()
-
-def test_create_tokens(monkeypatch):
-    captured = {}
-    async def fake_create_fungible_token(name, symbol, initial_supply, decimals, treasury_account_id=None):
-        captured["fungible"] = (name, symbol, initial_supply, decimals, treasury_account_id)
-        return "0.0.5001"
-    async def fake_create_non_fungible_token(name, symbol, treasury_account_id=None):
-        captured["nft"] = (name, symbol, treasury_account_id)
-        return "0.0.5002"
-    monkeypatch.setattr(tokens.hedera_token, "create_fungible_token", fake_create_fungible_token)
-    monkeypatch.setattr(tokens.hedera_token, "create_non_fungible_token", fake_create_non_fungible_token)
-    inp_f = tokens.CreateFungibleTokenInput(name="TokenA", symbol="TKA", initial_supply=1000, decimals=2)
-    res_f = asyncio.get_event_loop().run_until_complete(tokens.create_fungible_token(inp_f))
-    # 1000 with decimals=2 -> 100000 lowest units
-    assert captured["fungible"][2] == 1000 * (10 ** 2)
-    assert "TokenA" in res_f and "TKA" in res_f and "0.0.5001" in res_f
-    inp_nft = tokens.CreateNonFungibleTokenInput(name="MyNFT", symbol="MNFT")
-    res_nft = asyncio.get_event_loop().run_until_complete(tokens.create_non_fungible_token(inp_nft))
-    assert captured["nft"][0] == "MyNFT" and captured["nft"][1] == "MNFT"
-    assert "Non-fungible token created" in res_nft and "0.0.5002" in res_nft
-
-def test_update_token(monkeypatch):
-    async def fake_update_token(token_id, name=None, symbol=None):
-        assert token_id == "0.0.6006"
-        # Ensure at least one of name or symbol is provided
-        assert name is not None or symbol is not None
-    monkeypatch.setattr(tokens.hedera_token, "update_token", fake_update_token)
-    inp_none = tokens.UpdateTokenInput(token_id="0.0.6006")
-    with pytest.raises(ValueError):
-        asyncio.get_event_loop().run_until_complete(tokens.update_token(inp_none))
-    inp_name = tokens.UpdateTokenInput(token_id="0.0.6006", name="NewName")
-    res_name = asyncio.get_event_loop().run_until_complete(tokens.update_token(inp_name))
-    assert "updated" in res_name
-    inp_sym = tokens.UpdateTokenInput(token_id="0.0.6006", symbol="NEWSYM")
-    res_sym = asyncio.get_event_loop().run_until_complete(tokens.update_token(inp_sym))
-    assert "updated" in res_sym
-
-def test_mint_and_burn_tokens(monkeypatch):
-    called = {"mint": False, "burn": False}
-    async def fake_mint_token(token_id, amount):
-        called["mint"] = True
-        assert token_id == "0.0.7007" and amount == 500
-        return 1500
-    async def fake_burn_token(token_id, amount):
-        called["burn"] = True
-        assert token_id == "0.0.7007" and amount == 200
-    monkeypatch.setattr(tokens.hedera_token, "mint_token", fake_mint_token)
-    monkeypatch.setattr(tokens.hedera_token, "burn_token", fake_burn_token)
-    inp_mint = tokens.MintTokenInput(token_id="0.0.7007", amount=500)
-    res_mint = asyncio.get_event_loop().run_until_complete(tokens.mint_token(inp_mint))
-    assert called["mint"] and "Minted 500" in res_mint
-    inp_burn = tokens.BurnTokenInput(token_id="0.0.7007", amount=200)
-    res_burn = asyncio.get_event_loop().run_until_complete(tokens.burn_token(inp_burn))
-    assert called["burn"] and "Burned 200" in res_burn
-
-def test_mint_and_burn_nft(monkeypatch):
-    called = {"mint": False, "burn": False}
-    async def fake_mint_nft(token_id, metadata):
-        called["mint"] = True
-        assert token_id == "0.0.8008" and isinstance(metadata, list) and len(metadata) == 2
-        return 2
-    async def fake_burn_nft(token_id, serial_numbers):
-        called["burn"] = True
-        assert token_id == "0.0.8008" and serial_numbers == [1, 2]
-    monkeypatch.setattr(tokens.hedera_token, "mint_nft", fake_mint_nft)
-    monkeypatch.setattr(tokens.hedera_token, "burn_nft", fake_burn_nft)
-    meta_list = [b'NFT1', b'NFT2']
-    inp_mint = tokens.MintNftInput(token_id="0.0.8008", metadata=meta_list)
-    res_mint = asyncio.get_event_loop().run_until_complete(tokens.mint_nft(inp_mint))
-    assert called["mint"] and "Minted 2 NFT(s)" in res_mint
-    inp_burn = tokens.BurnNftInput(token_id="0.0.8008", serial_numbers=[1, 2])
-    res_burn = asyncio.get_event_loop().run_until_complete(tokens.burn_nft(inp_burn))
-    assert called["burn"] and "Burned 2 NFT(s)" in res_burn
-
-def test_transfer_token_conversion(monkeypatch):
-    async def fake_get_token_info(token_id):
-        return {"decimals": 3}
-    captured = {}
-    async def fake_transfer_token(token_id, to_account_id, amount):
-        captured["token_id"] = token_id
-        captured["to"] = to_account_id
-        captured["amount"] = amount
-    monkeypatch.setattr(tokens.hedera_token, "get_token_info", fake_get_token_info)
-    monkeypatch.setattr(tokens.hedera_token, "transfer_token", fake_transfer_token)
-    inp = tokens.TransferTokenInput(token_id="0.0.9009", to_account_id="0.0.1111", amount=5.5)
-    res = asyncio.get_event_loop().run_until_complete(tokens.transfer_token(inp))
-    # decimals=3, 5.5 -> 5500 in lowest units
-    assert captured["token_id"] == "0.0.9009"
-    assert captured["to"] == "0.0.1111"
-    assert captured["amount"] == 5500
-    assert "Transferred 5.5" in res
-
-def test_transfer_nft(monkeypatch):
-    done = {"called": False}
-    async def fake_transfer_nft(token_id, to_account_id, serial_number):
-        done["called"] = True
-        assert token_id == "0.0.9999" and to_account_id == "0.0.2222" and serial_number == 42
-    monkeypatch.setattr(tokens.hedera_token, "transfer_nft", fake_transfer_nft)
-    inp = tokens.TransferNftInput(token_id="0.0.9999", to_account_id="0.0.2222", serial_number=42)
-    res = asyncio.get_event_loop().run_until_complete(tokens.transfer_nft(inp))
-    assert done["called"] and "Transferred token 0.0.9999 serial 42" in res
-
-def test_associate_and_freeze_and_kyc(monkeypatch):
-    flags = {"assoc": False, "dissoc": False, "freeze": False, "unfreeze": False, "grant": False, "revoke": False}
-    async def fake_associate_token(account_id, token_id):
-        flags["assoc"] = True
-        assert account_id == "0.0.aaaa" and token_id == "0.0.TOKEN"
-    async def fake_dissociate_token(account_id, token_id):
-        flags["dissoc"] = True
-        assert account_id == "0.0.aaaa" and token_id == "0.0.TOKEN"
-    async def fake_freeze_token_account(token_id, account_id):
-        flags["freeze"] = True
-        assert token_id == "0.0.TKN" and account_id == "0.0.bbbb"
-    async def fake_unfreeze_token_account(token_id, account_id):
-        flags["unfreeze"] = True
-        assert token_id == "0.0.TKN" and account_id == "0.0.bbbb"
-    async def fake_grant_kyc(token_id, account_id):
-        flags["grant"] = True
-        assert token_id == "0.0.KYC" and account_id == "0.0.cccc"
-    async def fake_revoke_kyc(token_id, account_id):
-        flags["revoke"] = True
-        assert token_id == "0.0.KYC" and account_id == "0.0.cccc"
-    monkeypatch.setattr(tokens.hedera_token, "associate_token", fake_associate_token)
-    monkeypatch.setattr(tokens.hedera_token, "dissociate_token", fake_dissociate_token)
-    monkeypatch.setattr(tokens.hedera_token, "freeze_token_account", fake_freeze_token_account)
-    monkeypatch.setattr(tokens.hedera_token, "unfreeze_token_account", fake_unfreeze_token_account)
-    monkeypatch.setattr(tokens.hedera_token, "grant_kyc", fake_grant_kyc)
-    monkeypatch.setattr(tokens.hedera_token, "revoke_kyc", fake_revoke_kyc)
-    # Associate & Dissociate
-    inp_assoc = tokens.AssociateTokenInput(account_id="0.0.aaaa", token_id="0.0.TOKEN")
-    res_assoc = asyncio.get_event_loop().run_until_complete(tokens.associate_token(inp_assoc))
-    assert flags["assoc"] and "Associated" in res_assoc
-    inp_diss = tokens.DissociateTokenInput(account_id="0.0.aaaa", token_id="0.0.TOKEN")
-    res_diss = asyncio.get_event_loop().run_until_complete(tokens.dissociate_token(inp_diss))
-    assert flags["dissoc"] and "Dissociated" in res_diss
-    # Freeze & Unfreeze
-    inp_freeze = tokens.FreezeTokenAccountInput(token_id="0.0.TKN", account_id="0.0.bbbb")
-    res_freeze = asyncio.get_event_loop().run_until_complete(tokens.freeze_token_account(inp_freeze))
-    assert flags["freeze"] and "Frozen" in res_freeze
-    inp_unfreeze = tokens.UnfreezeTokenAccountInput(token_id="0.0.TKN", account_id="0.0.bbbb")
-    res_unfreeze = asyncio.get_event_loop().run_until_complete(tokens.unfreeze_token_account(inp_unfreeze))
-    assert flags["unfreeze"] and "Unfrozen" in res_unfreeze
-    # KYC Grant & Revoke
-    inp_grant = tokens.GrantKycInput(token_id="0.0.KYC", account_id="0.0.cccc")
-    res_grant = asyncio.get_event_loop().run_until_complete(tokens.grant_kyc(inp_grant))
-    assert flags["grant"] and "Granted KYC" in res_grant
-    inp_revoke = tokens.RevokeKycInput(token_id="0.0.KYC", account_id="0.0.cccc")
-    res_revoke = asyncio.get_event_loop().run_until_complete(tokens.revoke_kyc(inp_revoke))
-    assert flags["revoke"] and "Revoked KYC" in res_revoke
-
-def test_pause_and_wipe(monkeypatch):
-    flags = {"pause": False, "unpause": False, "wipe": False, "wipe_nft": False}
-    async def fake_pause_token(token_id):
-        flags["pause"] = True
-        assert token_id == "0.0.PAUSE"
-    async def fake_unpause_token(token_id):
-        flags["unpause"] = True
-        assert token_id == "0.0.PAUSE"
-    async def fake_get_token_info(token_id):
-        return {"decimals": 2}
-    async def fake_wipe_token_account(token_id, account_id, amount):
-        flags["wipe"] = True
-        assert token_id == "0.0.WIPE" and account_id == "0.0.dddd" and amount == 550
-    async def fake_wipe_token_account_nft(token_id, account_id, serial_numbers):
-        flags["wipe_nft"] = True
-        assert token_id == "0.0.WIPE" and account_id == "0.0.dddd" and serial_numbers == [10, 11]
-    monkeypatch.setattr(tokens.hedera_token, "pause_token", fake_pause_token)
-    monkeypatch.setattr(tokens.hedera_token, "unpause_token", fake_unpause_token)
-    monkeypatch.setattr(tokens.hedera_token, "get_token_info", fake_get_token_info)
-    monkeypatch.setattr(tokens.hedera_token, "wipe_token_account", fake_wipe_token_account)
-    monkeypatch.setattr(tokens.hedera_token, "wipe_token_account_nft", fake_wipe_token_account_nft)
-    inp_pause = tokens.PauseTokenInput(token_id="0.0.PAUSE")
-    res_pause = asyncio.get_event_loop().run_until_complete(tokens.pause_token(inp_pause))
-    assert flags["pause"] and "Paused token" in res_pause
-    inp_unpause = tokens.UnpauseTokenInput(token_id="0.0.PAUSE")
-    res_unpause = asyncio.get_event_loop().run_until_complete(tokens.unpause_token(inp_unpause))
-    assert flags["unpause"] and "Unpaused token" in res_unpause
-    inp_wipe = tokens.WipeTokenAccountInput(token_id="0.0.WIPE", account_id="0.0.dddd", amount=5.5)
-    res_wipe = asyncio.get_event_loop().run_until_complete(tokens.wipe_token_account(inp_wipe))
-    assert flags["wipe"] and "Wiped 5.5 tokens" in res_wipe
-    inp_wipe_nft = tokens.WipeTokenAccountNftInput(token_id="0.0.WIPE", account_id="0.0.dddd", serial_numbers=[10, 11])
-    res_wipe_nft = asyncio.get_event_loop().run_until_complete(tokens.wipe_token_account_nft(inp_wipe_nft))
-    assert flags["wipe_nft"] and "Wiped NFT serials" in res_wipe_nft
-
-def test_token_airdrop(monkeypatch):
-    async def fake_get_token_info(token_id):
-        return {"decimals": 0}
-    transfers = []
-    async def fake_transfer_token(token_id, to_account_id, amount):
-        transfers.append((to_account_id, amount))
-    monkeypatch.setattr(tokens.hedera_token, "get_token_info", fake_get_token_info)
-    monkeypatch.setattr(tokens.hedera_token, "transfer_token", fake_transfer_token)
-    recipients = [("0.0.X1", 10), ("0.0.X2", 20)]
-    inp = tokens.TokenAirdropInput(token_id="0.0.AAAA", recipients=recipients)
-    res = asyncio.get_event_loop().run_until_complete(tokens.token_airdrop(inp))
-    assert ("0.0.X1", 10) in transfers and ("0.0.X2", 20) in transfers
-    assert "0.0.X1" in res and "0.0.X2" in res and "Airdropped token 0.0.AAAA" in res
-
-def test_get_token_info(monkeypatch):
-    async def fake_get_token_info(token_id):
-        if token_id == "0.0.FUNG":
-            return {"name": "FToken", "symbol": "FT", "total_supply": 5000000, "decimals": 2}
-        if token_id == "0.0.NFT":
-            return {"name": "NToken", "symbol": "NT", "total_supply": 5, "decimals": 0}
-    monkeypatch.setattr(tokens.hedera_token, "get_token_info", fake_get_token_info)
-    inp_f = tokens.GetTokenInfoInput(token_id="0.0.FUNG")
-    res_f = asyncio.get_event_loop().run_until_complete(tokens.get_token_info(inp_f))
-    assert "FT" in res_f and "FToken" in res_f and "50000" in res_f  # 5000000 w/decimals=2 -> 50000.00
-    inp_n = tokens.GetTokenInfoInput(token_id="0.0.NFT")
-    res_n = asyncio.get_event_loop().run_until_complete(tokens.get_token_info(inp_n))
-    assert "NT" in res_n and "NToken" in res_n and "5" in res_n 
\ No newline at end of file
+# Every test in this module shares one event loop, created fresh for the module,
+# and runs on one xdist worker so the loop and module fixtures are built once
+pytestmark = [pytest.mark.asyncio(loop_scope="module"), pytest.mark.xdist_group(name="tokens")]
+
+# Mock responses are only served while hiero-sdk-python is missing
+mock_only = pytest.mark.skipif(tokens.SDK_AVAILABLE, reason="hiero-sdk-python is installed")
+
+_NOT_CONFIGURED = "❌ Error: Hedera client not configured. Please set OPERATOR_ID and OPERATOR_KEY."
+
+def _contains_all(*parts):
+    """One compiled pattern that matches text containing every part, in any order"""
+    return re.compile("".join(f"(?=.*{re.escape(part)})" for part in parts), re.S)
+
+_PAT_AIRDROP = _contains_all("Airdropped token 0.0.AAAA", "0.0.X1 (+10)", "0.0.X2 (+20)")
+
+# Inputs are frozen dataclasses, so tests can share one instance each
+INP_CREATE_FUNG = tokens.CreateFungibleTokenInput(name="TokenA", symbol="TKA", initial_supply=1000, decimals=2)
+INP_CREATE_NFT = tokens.CreateNonFungibleTokenInput(name="MyNFT", symbol="MNFT")
+INP_AIRDROP = tokens.TokenAirdropInput(token_id="0.0.AAAA", account_ids=["0.0.X1", "0.0.X2"], amounts=[10, 20])
+
+@mock_only
+async def test_create_fungible_token_mock(unconfigured):
+    res = await tokens.create_fungible_token(INP_CREATE_FUNG)
+    assert res == "🧪 Mock: Fungible token created - TokenA (TKA), ID: 0.0.789012"
+
+# Tools that need a configured client even in mock mode:
+# (operation, input, expected mock response once configured)
+_CONFIGURED_CASES = [
+    ("create_non_fungible_token", INP_CREATE_NFT, "🧪 Mock: NFT created - MyNFT (MNFT), ID: 0.0.789013"),
+    ("associate_token", tokens.AssociateTokenInput(account_id="0.0.aaaa", token_id="0.0.TOKEN"),
+     "🧪 Mock: Associated account 0.0.aaaa with token 0.0.TOKEN"),
+    ("dissociate_token", tokens.DissociateTokenInput(account_id="0.0.aaaa", token_id="0.0.TOKEN"),
+     "🧪 Mock: Dissociated account 0.0.aaaa from token 0.0.TOKEN"),
+    ("delete_token", tokens.DeleteTokenInput(token_id="0.0.TOKEN"), "🧪 Mock: Token 0.0.TOKEN deleted"),
+]
+
+@mock_only
+@pytest.mark.parametrize("op, inp, expected", _CONFIGURED_CASES, ids=[case[0] for case in _CONFIGURED_CASES])
+async def test_requires_configuration(unconfigured, op, inp, expected):
+    assert await getattr(tokens, op)(inp) == _NOT_CONFIGURED
+
+@mock_only
+@pytest.mark.parametrize("op, inp, expected", _CONFIGURED_CASES, ids=[case[0] for case in _CONFIGURED_CASES])
+async def test_configured_mock_responses(configured, op, inp, expected):
+    assert await getattr(tokens, op)(inp) == expected
+
+# Operations without a live implementation: (operation, input, expected mock response)
+_PLACEHOLDER_CASES = [
+    ("update_token", tokens.UpdateTokenInput(token_id="0.0.6006", name="NewName"), "🧪 Mock: Token 0.0.6006 updated"),
+    ("mint_token", tokens.MintTokenInput(token_id="0.0.7007", amount=500), "🧪 Mock: Minted 500 units to token 0.0.7007"),
+    ("burn_token", tokens.BurnTokenInput(token_id="0.0.7007", amount=200), "🧪 Mock: Burned 200 units from token 0.0.7007"),
+    ("mint_nft", tokens.MintNftInput(token_id="0.0.8008", metadata=[b'NFT1', b'NFT2']),
+     "🧪 Mock: Minted 2 NFT(s) for token 0.0.8008"),
+    ("burn_nft", tokens.BurnNftInput(token_id="0.0.8008", serial_numbers=[1, 2]), "🧪 Mock: Burned 2 NFT(s) of token 0.0.8008"),
+    ("transfer_token", tokens.TransferTokenInput(token_id="0.0.9009", to_account_id="0.0.1111", amount=5.5),
+     "🧪 Mock: Transferred 5.5 of token 0.0.9009 to 0.0.1111"),
+    ("transfer_nft", tokens.TransferNftInput(token_id="0.0.9999", to_account_id="0.0.2222", serial_number=42),
+     "🧪 Mock: Transferred NFT 0.0.9999#42 to 0.0.2222"),
+    ("freeze_token_account", tokens.FreezeTokenAccountInput(token_id="0.0.TKN", account_id="0.0.bbbb"),
+     "🧪 Mock: Frozen account 0.0.bbbb on token 0.0.TKN"),
+    ("unfreeze_token_account", tokens.UnfreezeTokenAccountInput(token_id="0.0.TKN", account_id="0.0.bbbb"),
+     "🧪 Mock: Unfrozen account 0.0.bbbb on token 0.0.TKN"),
+    ("grant_kyc", tokens.GrantKycInput(token_id="0.0.KYC", account_id="0.0.cccc"),
+     "🧪 Mock: Granted KYC for account 0.0.cccc on token 0.0.KYC"),
+    ("revoke_kyc", tokens.RevokeKycInput(token_id="0.0.KYC", account_id="0.0.cccc"),
+     "🧪 Mock: Revoked KYC for account 0.0.cccc on token 0.0.KYC"),
+    ("pause_token", tokens.PauseTokenInput(token_id="0.0.PAUSE"), "🧪 Mock: Paused token 0.0.PAUSE"),
+    ("unpause_token", tokens.UnpauseTokenInput(token_id="0.0.PAUSE"), "🧪 Mock: Unpaused token 0.0.PAUSE"),
+    ("wipe_token_account", tokens.WipeTokenAccountInput(token_id="0.0.WIPE", account_id="0.0.dddd", amount=5.5),
+     "🧪 Mock: Wiped 5.5 tokens of 0.0.WIPE from account 0.0.dddd"),
+    ("wipe_token_account_nft", tokens.WipeTokenAccountNftInput(token_id="0.0.WIPE", account_id="0.0.dddd", serial_numbers=[10, 11]),
+     "🧪 Mock: Wiped NFT serials [10, 11] of token 0.0.WIPE from account 0.0.dddd"),
+]
+
+@mock_only
+@pytest.mark.parametrize("op, inp, expected", _PLACEHOLDER_CASES, ids=[case[0] for case in _PLACEHOLDER_CASES])
+async def test_placeholder_mock_responses(unconfigured, op, inp, expected):
+    assert await getattr(tokens, op)(inp) == expected
+
+@mock_only
+async def test_token_airdrop_mock(unconfigured):
+    res = await tokens.token_airdrop(INP_AIRDROP)
+    assert _PAT_AIRDROP.search(res), res
+
+@mock_only
+async def test_get_token_info_mock(unconfigured):
+    token_ids = ["0.0.FUNG", "0.0.5001", "0.0.5002"]
+    results = await asyncio.gather(*(tokens.get_token_info(tokens.GetTokenInfoInput(token_id=t)) for t in token_ids))
+    # Concurrent lookups each answer for their own token
+    assert results == [f"🧪 Mock: Token {t}: MOCK (MockToken), total supply 10000" for t in token_ids]
+
+@pytest.mark.parametrize("total_supply, decimals, expected", [
+    (10000, 0, "10000"),
+    (10000, 2, "100.00"),
+    (5, 3, "0.005"),
+    # Beyond 2**53 a float division would round the last digits
+    (2**63 - 1, 8, "92233720368.54775807"),
+])
+async def test_format_supply(total_supply, decimals, expected):
+    assert tokens._format_supply(total_supply, decimals) == expected
+
+def _live(tool):
+    """The SDK implementation behind a tool, even when mock mode is bound in its place"""
+    return tool if tokens.SDK_AVAILABLE else tool.__wrapped__
+
+@pytest.fixture
+def submitted(configured, monkeypatch):
+    """Fake the transaction factories and submission; records (factory, args) and what was submitted"""
+    calls = []
+    def make_factory(name):
+        def factory(*args, **kwargs):
+            transaction = (name, args, kwargs)
+            calls.append(transaction)
+            return transaction
+        return factory
+    for name in ("_new_token_create_tx", "_new_associate_tx", "_new_dissociate_tx", "_new_delete_tx"):
+        monkeypatch.setattr(tokens, name, make_factory(name))
+    async def fake_execute(transaction):
+        calls.append(("submit", transaction))
+        return types.SimpleNamespace(tokenId="0.0.5001")
+    monkeypatch.setattr(tokens, "_execute_with_retry", fake_execute)
+    return calls
+
+async def test_create_fungible_token_submits(submitted):
+    res = await _live(tokens.create_fungible_token)(INP_CREATE_FUNG)
+    transaction = ("_new_token_create_tx", ("TokenA", "TKA", None), {"decimals": 2, "initial_supply": 1000})
+    assert submitted == [transaction, ("submit", transaction)]
+    assert res == "✅ Fungible token created: TokenA (TKA), ID: 0.0.5001, Initial supply: 1000"
+
+# (operation, input, factory, expected factory args, expected result)
+_SUBMIT_CASES = [
+    ("create_non_fungible_token", INP_CREATE_NFT, "_new_token_create_tx", ("MyNFT", "MNFT", None),
+     "✅ NFT created: MyNFT (MNFT), ID: 0.0.5001"),
+    ("associate_token", tokens.AssociateTokenInput(account_id="0.0.1111", token_id="0.0.5001"),
+     "_new_associate_tx", ("0.0.1111", "0.0.5001"), "✅ Associated account 0.0.1111 with token 0.0.5001"),
+    ("dissociate_token", tokens.DissociateTokenInput(account_id="0.0.1111", token_id="0.0.5001"),
+     "_new_dissociate_tx", ("0.0.1111", "0.0.5001"), "✅ Dissociated account 0.0.1111 from token 0.0.5001"),
+    ("delete_token", tokens.DeleteTokenInput(token_id="0.0.5001"), "_new_delete_tx", ("0.0.5001",),
+     "✅ Token 0.0.5001 deleted"),
+]
+
+@pytest.mark.parametrize("op, inp, factory, args, expected", _SUBMIT_CASES, ids=[case[0] for case in _SUBMIT_CASES])
+async def test_tools_submit_their_transaction(submitted, op, inp, factory, args, expected):
+    res = await _live(getattr(tokens, op))(inp)
+    transaction = (factory, args, {})
+    assert submitted == [transaction, ("submit", transaction)]
+    assert res == expected
+
+async def test_submission_failure_is_reported(submitted, monkeypatch):
+    async def failing_execute(transaction):
+        raise RuntimeError("INVALID_SIGNATURE")
+    monkeypatch.setattr(tokens, "_execute_with_retry", failing_execute)
+    res = await _live(tokens.associate_token)(tokens.AssociateTokenInput(account_id="0.0.1111", token_id="0.0.5001"))
+    assert res == "❌ Error associating token: INVALID_SIGNATURE"
+
+async def test_delete_token_drops_cached_info(submitted):
+    key = ("0.0.5001", tokens.client_manager().network)
+    tokens.get_token_info.cache.set(key, "✅ Token 0.0.5001: OLD (Old), total supply 1")
+    await _live(tokens.delete_token)(tokens.DeleteTokenInput(token_id="0.0.5001"))
+    assert tokens.get_token_info.cache.get(key) is None
+
+class _StatusError(Exception):
+    """PrecheckError stand-in carrying a ResponseCode name"""
+    def __init__(self, name):
+        super().__init__(name)
+        self.status = types.SimpleNamespace(name=name)
+
+class _RpcError(Exception):
+    """grpc.RpcError stand-in carrying a status code name"""
+    def __init__(self, name):
+        super().__init__(name)
+        self._code = types.SimpleNamespace(name=name)
+    def code(self):
+        return self._code
+
+class _FakeTransaction:
+    """Transaction whose submissions play back the given outcomes in order"""
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.node_account_id = "0.0.3"
+        self.transaction_id = "0.0.2@1700000000.000000000"
+        self.signatures = []
+        self.submissions = 0
+    def freeze_with(self, client):
+        pass
+    def sign(self, key):
+        self.signatures.append(key)
+    def execute(self, client):
+        self.submissions += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+RECEIPT = types.SimpleNamespace(status=22)
+
+@pytest.fixture
+def retrying(configured, monkeypatch):
+    """Retry without backoff; receipt lookups by transaction ID are recorded"""
+    monkeypatch.setattr(tokens, "_RETRY_DELAY", 0)
+    lookups = []
+    async def fake_receipt_for(transaction_id):
+        lookups.append(transaction_id)
+        return RECEIPT
+    monkeypatch.setattr(tokens, "_receipt_for", fake_receipt_for)
+    return lookups
+
+async def test_execute_with_retry_success(retrying):
+    transaction = _FakeTransaction(RECEIPT)
+    assert await tokens._execute_with_retry(transaction) is RECEIPT
+    assert transaction.submissions == 1 and len(transaction.signatures) == 1
+
+async def test_execute_with_retry_resubmits_transient_failures(retrying):
+    transaction = _FakeTransaction(_StatusError("BUSY"), _RpcError("DEADLINE_EXCEEDED"), RECEIPT)
+    assert await tokens._execute_with_retry(transaction) is RECEIPT
+    # Signed once; every attempt resends the same bytes
+    assert transaction.submissions == 3 and len(transaction.signatures) == 1
+    assert retrying == []
+
+async def test_execute_with_retry_gives_up(retrying, configured):
+    transaction = _FakeTransaction(*[_StatusError("BUSY")] * 3)
+    with pytest.raises(_StatusError):
+        await tokens._execute_with_retry(transaction)
+    assert transaction.submissions == 3
+    assert configured.default_node_account_id == "0.0.3"
+
+async def test_execute_with_retry_duplicate_fetches_receipt(retrying):
+    # The first copy reached consensus although its submission timed out
+    transaction = _FakeTransaction(_RpcError("DEADLINE_EXCEEDED"), _StatusError("DUPLICATE_TRANSACTION"))
+    assert await tokens._execute_with_retry(transaction) is RECEIPT
+    assert retrying == ["0.0.2@1700000000.000000000"]
+
+async def test_execute_with_retry_does_not_retry_other_errors(retrying, configured):
+    transaction = _FakeTransaction(_StatusError("INVALID_SIGNATURE"), RECEIPT)
+    with pytest.raises(_StatusError):
+        await tokens._execute_with_retry(transaction)
+    assert transaction.submissions == 1
+    assert configured.default_node_account_id == "0.0.3"
+
+@pytest.mark.parametrize("error", [_StatusError("INVALID_NODE_ACCOUNT"), _RpcError("UNAVAILABLE")], ids=str)
+async def test_execute_with_retry_rotates_failed_node(retrying, configured, error):
+    transaction = _FakeTransaction(*[error] * 3)
+    with pytest.raises(type(error)):
+        await tokens._execute_with_retry(transaction)
+    assert configured.default_node_account_id == "0.0.4"
+
+@pytest.fixture
+def airdrop_batches(configured, monkeypatch):
+    """Fake batch building and submission; records each batch's (account_ids, amounts)"""
+    batches = []
+    def fake_build(client, token_id, account_ids, amounts):
+        batches.append((account_ids, amounts))
+        return (account_ids, amounts)
+    async def fake_execute(batch):
+        return types.SimpleNamespace(status="SUCCESS")
+    monkeypatch.setattr(tokens, "parse_token_id", lambda token_id: token_id)
+    monkeypatch.setattr(tokens, "_build_airdrop_batch", fake_build)
+    monkeypatch.setattr(tokens, "_execute_with_retry", fake_execute)
+    monkeypatch.setattr(tokens, "_receipt_status", lambda receipt: receipt.status)
+    return batches
+
+def _airdrop_input(count):
+    return tokens.TokenAirdropInput(
+        token_id="0.0.AAAA", account_ids=[f"0.0.{1000 + n}" for n in range(count)], amounts=[1] * count
+    )
+
+@pytest.mark.parametrize("count, sizes", [(1, [1]), (50, [50]), (51, [50, 1]), (120, [50, 50, 20])])
+async def test_token_airdrop_batches(airdrop_batches, count, sizes):
+    inp = _airdrop_input(count)
+    res = await _live(tokens.token_airdrop)(inp)
+    assert sorted(len(account_ids) for account_ids, _ in airdrop_batches) == sorted(sizes)
+    # Every recipient is in exactly one batch
+    assert sorted(a for account_ids, _ in airdrop_batches for a in account_ids) == sorted(inp.account_ids)
+    assert res == f"✅ Airdropped {count} of token 0.0.AAAA to {count} account(s) in {len(sizes)} batch(es)"
+
+async def test_token_airdrop_reports_each_batch(airdrop_batches, monkeypatch):
+    async def fake_execute(batch):
+        account_ids, _ = batch
+        if account_ids[0] == "0.0.1050":
+            raise _StatusError("INSUFFICIENT_TOKEN_BALANCE")
+        return types.SimpleNamespace(status="SUCCESS")
+    monkeypatch.setattr(tokens, "_execute_with_retry", fake_execute)
+    res = await _live(tokens.token_airdrop)(_airdrop_input(120))
+    assert res.splitlines() == [
+        "❌ Error airdropping token 0.0.AAAA: 1 of 3 batch(es) failed",
+        "✅ Batch 1, recipients 1-50: SUCCESS",
+        "❌ Batch 2, recipients 51-100: INSUFFICIENT_TOKEN_BALANCE",
+        "✅ Batch 3, recipients 101-120: SUCCESS",
+    ]
+
+async def test_token_airdrop_rejects_empty_recipients(airdrop_batches):
+    inp = tokens.TokenAirdropInput(token_id="0.0.AAAA", account_ids=[], amounts=[])
+    assert await _live(tokens.token_airdrop)(inp) == "❌ Error airdropping token: no recipients given"
+    assert airdrop_batches == []
+
+async def test_token_airdrop_input_stores_tuples():
+    inp = tokens.TokenAirdropInput(token_id="0.0.AAAA", account_ids=["0.0.X1", "0.0.X2"], amounts=[10, 20])
+    assert inp.account_ids == ("0.0.X1", "0.0.X2") and inp.amounts == (10, 20)
+    # Hashable, so equal inputs can share cache entries
+    assert hash(inp) == hash(INP_AIRDROP)
+
+async def test_token_airdrop_input_rejects_mismatched_lengths():
+    with pytest.raises(ValueError, match="2 account IDs but 1 amounts"):
+        tokens.TokenAirdropInput(token_id="0.0.AAAA", account_ids=["0.0.X1", "0.0.X2"], amounts=[10])
+
+@pytest.mark.parametrize("amounts, error, message", [
+    ([5, 0], ValueError, "must be positive, got 0"),
+    ([5, -1], ValueError, "must be positive, got -1"),
+    ([5, "10"], TypeError, "must be integers, got '10'"),
+    ([5, 2.5], TypeError, "must be integers, got 2.5"),
+    ([5, True], TypeError, "must be integers, got True"),
+])
+async def test_token_airdrop_input_rejects_bad_amounts(amounts, error, message):
+    with pytest.raises(error, match=message):
+        tokens.TokenAirdropInput(token_id="0.0.AAAA", account_ids=["0.0.X1", "0.0.X2"], amounts=amounts)